@@ -5,21 +5,45 @@ video processing, and platform subfolder organization
 """
 
 import os
+import json
+import logging
+import logging.handlers
 import shutil
+import subprocess
 import sys
+import time
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Set, Optional
+from typing import Dict, List, Tuple, Set, FrozenSet, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
 import re
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET  # Streams large platform XMLs much faster
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+try:
+    from PIL import Image, ImageTk  # Smooth logo scaling, cached between launches
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
 
 try:
     from rapidfuzz import fuzz, process
+    import numpy as np
 except ImportError:
     messagebox.showerror("Missing Dependency", 
-                        "Please install rapidfuzz:\npip install rapidfuzz")
+                        "Please install rapidfuzz and numpy:\npip install rapidfuzz numpy")
     exit(1)
 
 
@@ -34,6 +58,230 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def load_logo_image(size: int = 48):
+    """Load logo.png scaled to fit size x size, or return None if there is no logo.
+    With Pillow the logo is LANCZOS-resized once and the result cached next to it,
+    so later launches skip the full-size decode; without it, fall back to PhotoImage.subsample.
+    """
+    logo_path = resource_path('logo.png')
+    if not os.path.exists(logo_path):
+        return None
+    
+    if not HAS_PIL:
+        logo_img = tk.PhotoImage(file=logo_path)
+        subsample_x = max(1, logo_img.width() // size)
+        subsample_y = max(1, logo_img.height() // size)
+        return logo_img.subsample(subsample_x, subsample_y)
+    
+    cache_path = resource_path(f'logo_{size}.png')
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(logo_path):
+            return ImageTk.PhotoImage(Image.open(cache_path))
+    except OSError:
+        pass  # No cached copy yet
+    
+    logo = Image.open(logo_path).convert('RGBA')
+    logo.thumbnail((size, size), Image.LANCZOS)
+    try:
+        logo.save(cache_path, optimize=True)
+    except OSError:
+        pass  # Read-only install, just resize again next launch
+    return ImageTk.PhotoImage(logo)
+
+
+# Images scored per rapidfuzz.process.cdist call (bounds score matrix memory)
+FUZZY_BLOCK_SIZE = 512
+
+# Minimum seconds between repeated progress callbacks (~30 updates/sec)
+PROGRESS_INTERVAL = 0.033
+
+# How often the GUI applies queued progress from the worker thread (milliseconds)
+PROGRESS_POLL_MS = 100
+
+# Results text longer than this is inserted in idle-time chunks of this many characters
+RESULTS_CHUNK_CHARS = 8192
+
+# Processing errors are logged here with their traceback
+ERROR_LOG_PATH = os.path.join(os.path.expanduser('~'), '.trailervert_image_renamer.log')
+
+logger = logging.getLogger('rom_matcher')
+
+# Last-used settings, shared by the TrailerVert tools (one section per tool)
+CONFIG_PATH = os.path.join(os.path.expanduser('~'), '.trailervert.json')
+CONFIG_SECTION = 'image_renamer'
+
+
+def load_config() -> Dict:
+    """Read the saved settings file, or return {} if it is missing or unreadable"""
+    try:
+        with open(CONFIG_PATH, encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
+def save_config_section(section: str, values: Dict):
+    """Replace one tool's section of the settings file, keeping the others"""
+    config = load_config()
+    config[section] = values
+    try:
+        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not save settings: {e}")
+
+
+def start_error_logging() -> logging.handlers.QueueListener:
+    """Route logger records through a queue to ERROR_LOG_PATH, written on the listener's thread.
+    Call stop() on the returned listener at exit to flush it.
+    """
+    log_queue = queue.Queue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    
+    file_handler = logging.FileHandler(ERROR_LOG_PATH, encoding='utf-8', delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
+# Report lines kept in memory for the return value; the full report goes to the log file
+LOG_TAIL_LINES = 500
+
+# Name patterns, compiled once at import
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+
+# Characters LaunchBox replaces with '_' in media filenames (v2.2: includes apostrophes)
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in ':\'/\\?*"<>|'})
+
+# Per-run counters in ROMImageMatcherV2.stats
+_STAT_KEYS = (
+    'roms_found',
+    'images_found',
+    'duplicates_removed',
+    'auto_matched',
+    'xml_matched',
+    'exact_matched',  # NEW: Already correctly named
+    'fuzzy_matched',
+    'no_match',
+    'unmatched_images',
+    'extension_conflicts',  # v3.0
+)
+
+
+def _split_suffix(name: str) -> Tuple[str, Optional[str]]:
+    """Split a -01, -02, etc. suffix off a name using plain string ops.
+    Returns (base_name, digits), digits is None when there is no suffix.
+    """
+    dash = name.rfind('-')
+    if dash >= 0:
+        digits = name[dash + 1:]
+        if digits.isdecimal():
+            return name[:dash], digits
+    return name, None
+
+
+def _split_ext(name: str) -> Tuple[str, str]:
+    """Split a file name into (stem, extension) with the same rules as Path.stem/suffix,
+    without building a Path object
+    """
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ''
+
+
+def _strip_suffix(name: str) -> str:
+    """Remove a -01, -02, etc. suffix from a name"""
+    return _split_suffix(name)[0]
+
+
+@lru_cache(maxsize=8192)
+def _normalize_name(name: str) -> str:
+    """Normalize filename for fuzzy comparison"""
+    # Remove file extension
+    name = Path(name).stem
+    
+    # Remove -01, -02, etc. suffixes
+    name = _strip_suffix(name)
+    
+    # Replace underscores with spaces
+    name = name.replace('_', ' ')
+    
+    # Normalize spacing
+    return ' '.join(name.split())
+
+
+@lru_cache(maxsize=8192)
+def _get_core_name(name: str) -> str:
+    """Get core game name without region tags for matching"""
+    # Most names without tags skip the regex engine entirely
+    if '(' not in name and '[' not in name:
+        return name.strip()
+    
+    # Remove common region/version tags for fuzzy matching
+    core = _PAREN_RE.sub('', name)  # Remove parenthetical content
+    core = _BRACKET_RE.sub('', core)  # Remove bracketed content
+    return core.strip()
+
+
+def _prepare_names(names: List[str]) -> Tuple[List[str], List[str]]:
+    """Return the (normalized, core) forms of names for fuzzy scoring.
+    map() drives the cached helpers straight from C, so cache hits never enter the interpreter.
+    """
+    normalized = list(map(_normalize_name, names))
+    return normalized, list(map(_get_core_name, normalized))
+
+
+def _is_substring_match(a: str, b: str) -> bool:
+    """True when fuzz.partial_ratio(a, b) is 100, i.e. the shorter string occurs in the longer"""
+    shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+    return shorter in longer and (bool(shorter) or not longer)
+
+
+def _scan_files(folder: str):
+    """Yield a DirEntry for every file below folder, in the same order as os.walk"""
+    subfolders = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if not is_dir:
+                    yield entry
+                elif not entry.is_symlink():  # os.walk doesn't follow links
+                    subfolders.append(entry.path)
+    except OSError:
+        return
+    
+    for subfolder in subfolders:
+        yield from _scan_files(subfolder)
+
+
+class _ProcessingLog:
+    """Stream report lines straight to the log file, keeping only the last few in memory"""
+    
+    def __init__(self, path: str, tail_size: int = LOG_TAIL_LINES):
+        self.file = open(path, 'w', encoding='utf-8', buffering=1 << 16)
+        self.tail = deque(maxlen=tail_size)
+        self.empty = True
+    
+    def append(self, line: str):
+        if not self.empty:
+            self.file.write("\n")
+        self.file.write(line)
+        self.tail.append(line)
+        self.empty = False
+    
+    def close(self):
+        self.file.close()
+
+
 class ROMImageMatcherV2:
     def __init__(self):
         self.xml_file = ""
@@ -45,18 +293,7 @@ class ROMImageMatcherV2:
         self.selected_image_type = ""
         
         # Statistics
-        self.stats = {
-            'roms_found': 0,
-            'images_found': 0,
-            'duplicates_removed': 0,
-            'auto_matched': 0,
-            'xml_matched': 0,
-            'exact_matched': 0,  # NEW: Already correctly named
-            'fuzzy_matched': 0,
-            'no_match': 0,
-            'unmatched_images': 0,
-            'extension_conflicts': 0  # v3.0
-        }
+        self.stats = dict.fromkeys(_STAT_KEYS, 0)
         
         # Priority folder tracking
         self.priority_folders = ['Box - Front', 'Clear Logo']
@@ -67,12 +304,22 @@ class ROMImageMatcherV2:
         self.xml_mapping = {}  # {sanitized_title: rom_filename_no_ext}
         self.images = {}  # {relative_path: {name_no_ext: full_path}}
         self.matches = {}  # {image_path: (rom_name, image_type_folder)}
+        self.matched_roms = set()  # ROM names in self.matches, kept as matches are recorded
         self.unmatched_roms = []
         self.unmatched_images = []
         self.available_image_types = []
         
+        # ROM lookup table, built once per ROM scan (see prepare_rom_table)
+        self._rom_table_source = None  # The self.roms dict the table was built from
+        self._rom_names = []  # In scan order, fuzzy ties go to the first ROM
+        self._rom_set = frozenset()
+        self._rom_normalized = []
+        self._rom_core = []
+        self._rom_usa_mask = None
+        
         # Image extensions
         self.image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp'}
+        self._ext_tuple = tuple(self.image_extensions)  # For str.endswith checks
         
         # Extension preference for duplicate handling (v3.0)
         self.extension_preference = None  # None, '.jpg', '.png', etc.
@@ -86,21 +333,22 @@ class ROMImageMatcherV2:
         
         # Progress callback (v2.2)
         self.progress_callback = None
-        
+        self._last_progress_time = 0.0
+    
+    def reset_run_state(self):
+        """Clear the stats and results of the previous run before starting a new one"""
+        self.stats = dict.fromkeys(_STAT_KEYS, 0)
+        self.priority_stats = {}
+        self.matches = {}
+        self.matched_roms = set()
+        self.unmatched_images = []
+        self.unmatched_roms = []
+        self.extension_conflicts = []  # v3.0
+    
     def sanitize_title(self, title: str) -> str:
         """Sanitize title the way LaunchBox does for filenames"""
-        # Replace characters that can't be in filenames
-        sanitized = title.replace(':', '_')
-        sanitized = sanitized.replace("'", '_')  # v2.2: Handle apostrophes
-        sanitized = sanitized.replace('/', '_')
-        sanitized = sanitized.replace('\\', '_')
-        sanitized = sanitized.replace('?', '_')
-        sanitized = sanitized.replace('*', '_')
-        sanitized = sanitized.replace('"', '_')
-        sanitized = sanitized.replace('<', '_')
-        sanitized = sanitized.replace('>', '_')
-        sanitized = sanitized.replace('|', '_')
-        return sanitized
+        # Replace characters that can't be in filenames, in one pass
+        return title.translate(_SANITIZE_TABLE)
     
     def extract_platform_name(self) -> str:
         """Extract platform name from XML filename (v3.0)"""
@@ -121,26 +369,34 @@ class ROMImageMatcherV2:
             return mapping
         
         try:
-            tree = ET.parse(self.xml_file)
-            root = tree.getroot()
+            # Stream <Game> elements instead of building the whole tree
+            if HAS_LXML:
+                context = ET.iterparse(self.xml_file, events=('end',), tag='Game')
+            else:
+                context = ET.iterparse(self.xml_file, events=('end',))
             
-            for game in root.findall('Game'):
-                title_elem = game.find('Title')
-                app_path_elem = game.find('ApplicationPath')
+            for event, game in context:
+                if game.tag != 'Game':
+                    continue
+                
+                title = game.findtext('Title')
+                app_path = game.findtext('ApplicationPath')
                 
-                if title_elem is not None and app_path_elem is not None:
-                    title = title_elem.text
-                    app_path = app_path_elem.text
+                if title and app_path:
+                    # Extract just the filename from the path
+                    rom_filename = os.path.basename(app_path)
+                    rom_name_no_ext = _split_ext(rom_filename)[0]
+                    
+                    # Sanitize title for matching with image names
+                    sanitized_title = self.sanitize_title(title)
                     
-                    if title and app_path:
-                        # Extract just the filename from the path
-                        rom_filename = os.path.basename(app_path)
-                        rom_name_no_ext = Path(rom_filename).stem
-                        
-                        # Sanitize title for matching with image names
-                        sanitized_title = self.sanitize_title(title)
-                        
-                        mapping[sanitized_title] = rom_name_no_ext
+                    mapping[sanitized_title] = rom_name_no_ext
+                
+                # Free parsed games so memory stays flat on large XMLs
+                game.clear()
+                if HAS_LXML:
+                    while game.getprevious() is not None:
+                        del game.getparent()[0]
             
             return mapping
             
@@ -150,27 +406,11 @@ class ROMImageMatcherV2:
     
     def normalize_name(self, name: str) -> str:
         """Normalize filename for fuzzy comparison"""
-        # Remove file extension
-        name = Path(name).stem
-        
-        # Remove -01, -02, etc. suffixes
-        name = re.sub(r'-\d+$', '', name)
-        
-        # Replace underscores with spaces
-        name = name.replace('_', ' ')
-        
-        # Normalize spacing
-        name = ' '.join(name.split())
-        
-        return name
+        return _normalize_name(name)
     
     def get_core_name(self, name: str) -> str:
         """Get core game name without region tags for matching"""
-        # Remove common region/version tags for fuzzy matching
-        core = re.sub(r'\([^)]*\)', '', name)  # Remove parenthetical content
-        core = re.sub(r'\[[^\]]*\]', '', core)  # Remove bracketed content
-        core = core.strip()
-        return core
+        return _get_core_name(name)
     
     def is_usa_rom(self, rom_name: str) -> bool:
         """Check if ROM is USA region"""
@@ -190,27 +430,25 @@ class ROMImageMatcherV2:
         # Multi-file ROM extensions (use .bin as the identifier)
         multi_file_extensions = {'.bin', '.gdi'}
         
-        # Scan for both files and directories
-        for item in os.listdir(self.rom_folder):
-            item_path = os.path.join(self.rom_folder, item)
-            
-            # Handle regular ROM files
-            if os.path.isfile(item_path):
-                name_no_ext = Path(item).stem
-                roms[name_no_ext] = item_path
-            
-            # Handle multi-file ROM directories (v2.2)
-            elif os.path.isdir(item_path):
-                # Look for .bin or .gdi files in subdirectory
-                for subfile in os.listdir(item_path):
-                    subfile_path = os.path.join(item_path, subfile)
-                    if os.path.isfile(subfile_path):
-                        ext = Path(subfile).suffix.lower()
-                        if ext in multi_file_extensions:
-                            # Use the .bin/.gdi filename (without extension) as ROM name
-                            name_no_ext = Path(subfile).stem
-                            roms[name_no_ext] = subfile_path
-                            break  # Only take first .bin/.gdi found
+        # Scan for both files and directories (scandir reuses the directory entry type)
+        with os.scandir(self.rom_folder) as entries:
+            for entry in entries:
+                # Handle regular ROM files
+                if entry.is_file():
+                    name_no_ext = _split_ext(entry.name)[0]
+                    roms[name_no_ext] = entry.path
+                
+                # Handle multi-file ROM directories (v2.2)
+                elif entry.is_dir():
+                    # Look for .bin or .gdi files in subdirectory
+                    with os.scandir(entry.path) as subentries:
+                        for subentry in subentries:
+                            if subentry.is_file():
+                                name_no_ext, ext = _split_ext(subentry.name)
+                                if ext.lower() in multi_file_extensions:
+                                    # Use the .bin/.gdi filename (without extension) as ROM name
+                                    roms[name_no_ext] = subentry.path
+                                    break  # Only take first .bin/.gdi found
         
         return roms
     
@@ -221,86 +459,122 @@ class ROMImageMatcherV2:
         if not os.path.exists(self.platform_image_folder):
             return types
         
-        for item in os.listdir(self.platform_image_folder):
-            item_path = os.path.join(self.platform_image_folder, item)
-            if os.path.isdir(item_path):
-                # Check if this folder contains any images (recursively)
-                if self.has_images_recursive(item_path):
-                    types.append(item)
+        with os.scandir(self.platform_image_folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Check if this folder contains any images (recursively)
+                    if self.has_images_recursive(entry.path):
+                        types.append(entry.name)
         
         return sorted(types)
     
+    def is_image_file(self, filename: str) -> bool:
+        """Check the file extension against image_extensions (case-insensitive)"""
+        return (filename.lower().endswith(self._ext_tuple)
+                and filename.rfind('.') > 0)  # A bare ".png" has no extension
+    
     def has_images_recursive(self, folder: str) -> bool:
-        """Check if folder contains any images (recursively)"""
-        for root, dirs, files in os.walk(folder):
-            for file in files:
-                ext = Path(file).suffix.lower()
-                if ext in self.image_extensions:
-                    return True
-        return False
+        """Check if folder contains any images (recursively), stopping at the first one"""
+        return any(self.is_image_file(entry.name) for entry in _scan_files(folder))
     
     def scan_images_in_type_folder(self, type_folder_path: str) -> Dict[str, str]:
         """Scan a specific image type folder recursively, return {name_no_ext: full_path}
         v3.0: Handles duplicate extensions (e.g., Space Invaders.jpg AND Space Invaders.png)
         """
+        images, conflicts, _ = self.collect_images_in_type_folder(type_folder_path)
+        self.record_extension_conflicts(conflicts)
+        return images
+    
+    def collect_images_in_type_folder(self, type_folder_path: str) -> Tuple[Dict[str, str], List[Tuple],
+                                                                            Dict[str, List[Tuple]]]:
+        """Scan a type folder without touching shared state, safe to run from worker threads.
+        Returns ({name_no_ext: full_path}, [(base_name, extensions_found)], duplicates)
+        where duplicates has the same shape as find_duplicates_in_folder() output
+        """
         from collections import defaultdict
         
         images = {}
-        files_by_base = defaultdict(list)  # {base_name: [(ext, path, full_name)]}
+        conflicts = []
+        duplicates = {}
+        files_by_base = defaultdict(list)  # {base_name: [(ext, path, full_name, suffix_digits)]}
         
         # First pass: collect all images grouped by base name
-        for root, dirs, files in os.walk(type_folder_path):
-            for file in files:
-                ext = Path(file).suffix.lower()
-                if ext in self.image_extensions:
-                    file_path = os.path.join(root, file)
-                    name_no_ext = Path(file).stem
-                    # Remove -01, -02 suffix to get base name
-                    base_name = re.sub(r'-\d+$', '', name_no_ext)
-                    
-                    # Group all variants of this base name
-                    files_by_base[base_name].append((ext, file_path, name_no_ext))
+        for entry in _scan_files(type_folder_path):
+            if self.is_image_file(entry.name):
+                name_no_ext, ext = _split_ext(entry.name)
+                ext = ext.lower()
+                # Remove -01, -02 suffix to get base name
+                base_name, digits = _split_suffix(name_no_ext)
+                
+                # Group all variants of this base name
+                files_by_base[base_name].append((ext, entry.path, name_no_ext, digits))
         
         # Second pass: handle extension conflicts (v3.0)
         for base_name, file_list in files_by_base.items():
             # Get unique extensions for this base name
-            extensions_found = sorted(set(ext for ext, _, _ in file_list))
+            extensions_found = sorted(set(ext for ext, _, _, _ in file_list))
             
             if len(extensions_found) > 1:
                 # CONFLICT: Multiple file types for same base name
-                self.extension_conflicts.append((base_name, extensions_found))
-                self.stats['extension_conflicts'] += 1
+                conflicts.append((base_name, extensions_found))
                 
                 # Decide which extension to keep
                 if self.extension_preference and self.extension_preference in extensions_found:
                     # Keep ONLY the preferred extension
-                    for ext, path, name in file_list:
-                        if ext == self.extension_preference:
-                            images[name] = path
+                    kept_ext = self.extension_preference
                 else:
                     # No preference - keep first extension alphabetically
                     kept_ext = extensions_found[0]
-                    for ext, path, name in file_list:
-                        if ext == kept_ext:
-                            images[name] = path
+                kept_files = [f for f in file_list if f[0] == kept_ext]
             else:
                 # No conflict - add all files
-                for ext, path, name in file_list:
-                    images[name] = path
-        
-        return images
+                kept_files = file_list
+            
+            for ext, path, name, digits in kept_files:
+                images[name] = path
+            
+            # The kept -01, -02, etc. variants are this base name's duplicate group
+            if base_name:
+                variants = {}  # {name: suffix_num}, in the order images saw them
+                for ext, path, name, digits in kept_files:
+                    if digits is not None and name not in variants:
+                        variants[name] = int(digits)
+                if len(variants) > 1:
+                    duplicates[base_name] = [(suffix_num, name, images[name])
+                                             for name, suffix_num in variants.items()]
+        
+        return images, conflicts, duplicates
+    
+    def record_extension_conflicts(self, conflicts: List[Tuple]):
+        """Add extension conflicts found by a folder scan to the run totals"""
+        self.extension_conflicts.extend(conflicts)
+        self.stats['extension_conflicts'] += len(conflicts)
     
-    def scan_all_images(self, image_types: List[str]) -> Dict[str, Dict[str, str]]:
-        """Scan all specified image type folders"""
+    def scan_all_images(self, image_types: List[str]) -> Tuple[Dict[str, Dict[str, str]],
+                                                               Dict[str, Dict[str, List[Tuple]]]]:
+        """Scan all specified image type folders, one worker thread per folder.
+        Returns ({image_type: images}, {image_type: duplicates})
+        """
         all_images = {}
+        all_duplicates = {}
+        if not image_types:
+            return all_images, all_duplicates
+        
+        type_folder_paths = [os.path.join(self.platform_image_folder, image_type)
+                             for image_type in image_types]
+        
+        # Folder walks are I/O bound, so threads overlap the directory reads
+        with ThreadPoolExecutor(max_workers=min(16, len(image_types))) as executor:
+            results = list(executor.map(self.collect_images_in_type_folder, type_folder_paths))
         
-        for image_type in image_types:
-            type_folder_path = os.path.join(self.platform_image_folder, image_type)
-            images = self.scan_images_in_type_folder(type_folder_path)
+        # Record conflicts in folder order so reports stay stable
+        for image_type, (images, conflicts, duplicates) in zip(image_types, results):
+            self.record_extension_conflicts(conflicts)
             if images:
                 all_images[image_type] = images
+                all_duplicates[image_type] = duplicates
         
-        return all_images
+        return all_images, all_duplicates
     
     def find_duplicates_in_folder(self, images: Dict[str, str]) -> Dict[str, List[Tuple]]:
         """Find duplicate images (same base name with -01, -02, etc.)"""
@@ -308,10 +582,9 @@ class ROMImageMatcherV2:
         
         for img_name, img_path in images.items():
             # Check if this has a number suffix
-            match = re.match(r'(.+)-(\d+)$', img_name)
-            if match:
-                base_name = match.group(1)
-                suffix_num = int(match.group(2))
+            base_name, digits = _split_suffix(img_name)
+            if digits is not None and base_name:
+                suffix_num = int(digits)
                 
                 if base_name not in duplicates:
                     duplicates[base_name] = []
@@ -323,11 +596,14 @@ class ROMImageMatcherV2:
         
         return duplicates
     
-    def remove_duplicates_in_folder(self, images: Dict[str, str]) -> Tuple[int, Dict[str, str]]:
-        """Remove duplicate images, keeping -01 versions. Returns (count_removed, updated_images)"""
-        duplicates = self.find_duplicates_in_folder(images)
-        removed_count = 0
-        updated_images = images.copy()
+    def remove_duplicates_in_folder(self, images: Dict[str, str],
+                                    duplicates: Optional[Dict[str, List[Tuple]]] = None) -> Tuple[int, Dict[str, str]]:
+        """Remove duplicate images, keeping -01 versions. Returns (count_removed, updated_images)
+        Pass the duplicates found by the folder scan to skip searching images again.
+        """
+        if duplicates is None:
+            duplicates = self.find_duplicates_in_folder(images)
+        to_delete = []  # [(img_name, img_path)]
         
         for base_name, images_list in duplicates.items():
             # Sort by suffix number
@@ -335,16 +611,37 @@ class ROMImageMatcherV2:
             
             # Keep -01 (first item), remove others
             for suffix_num, img_name, img_path in images_list[1:]:
-                try:
-                    os.remove(img_path)
-                    removed_count += 1
-                    # Remove from our images dict
-                    if img_name in updated_images:
-                        del updated_images[img_name]
-                except Exception as e:
-                    print(f"Error removing {img_path}: {e}")
+                to_delete.append((img_name, img_path))
+        
+        errors = self.remove_files_parallel([img_path for _, img_path in to_delete])
+        
+        removed = set()
+        for (img_name, img_path), error in zip(to_delete, errors):
+            if error is None:
+                removed.add(img_name)
+            else:
+                print(f"Error removing {img_path}: {error}")
+        
+        # Build the trimmed dict once instead of copying and deleting key by key
+        updated_images = {name: path for name, path in images.items() if name not in removed}
+        
+        return len(removed), updated_images
+    
+    def remove_files_parallel(self, paths: List[str]) -> List[Optional[Exception]]:
+        """Delete files on a thread pool, return the error (or None) for each path"""
+        def remove(path):
+            try:
+                os.remove(path)
+            except Exception as e:
+                return e
+            return None
+        
+        if not paths:
+            return []
         
-        return removed_count, updated_images
+        # Deletes are independent syscalls, so threads overlap the I/O
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(remove, paths))
     
     def match_image_to_rom_xml(self, img_name: str) -> Optional[str]:
         """Try to match image to ROM using XML mapping"""
@@ -352,7 +649,7 @@ class ROMImageMatcherV2:
             return None
         
         # Remove -01, -02 suffix
-        base_name = re.sub(r'-\d+$', '', img_name)
+        base_name = _strip_suffix(img_name)
         
         # Direct lookup in XML mapping
         if base_name in self.xml_mapping:
@@ -360,89 +657,143 @@ class ROMImageMatcherV2:
         
         return None
     
-    def match_image_to_rom_exact(self, img_name: str, rom_names: List[str]) -> Optional[str]:
+    def match_image_to_rom_exact(self, img_name: str, rom_set: FrozenSet[str]) -> Optional[str]:
         """Try to match image to ROM by exact name (already correctly named)"""
         # Remove -01, -02 suffix from image name
-        base_name = re.sub(r'-\d+$', '', img_name)
+        base_name = _strip_suffix(img_name)
         
-        # Check if image name exactly matches a ROM name
-        if base_name in rom_names:
+        # Check if image name exactly matches a ROM name (O(1) set lookup)
+        if base_name in rom_set:
             return base_name
         
         return None
     
     def match_image_to_rom_fuzzy(self, img_name: str, rom_names: List[str]) -> Tuple[Optional[str], float]:
         """Try to match image to ROM using fuzzy matching"""
-        normalized_image = self.normalize_name(img_name)
-        core_image = self.get_core_name(normalized_image)
-        
-        # Create list of normalized ROM names
-        rom_choices = []
-        for rom in rom_names:
-            normalized_rom = self.normalize_name(rom)
-            rom_choices.append((normalized_rom, rom))
-        
-        # Get all matches above threshold
-        matches = []
-        for normalized_rom, original_rom in rom_choices:
-            core_rom = self.get_core_name(normalized_rom)
-            
-            # Try multiple matching strategies
-            score1 = fuzz.ratio(normalized_image, normalized_rom)
-            score2 = fuzz.ratio(core_image, core_rom)
-            score3 = fuzz.partial_ratio(normalized_image, normalized_rom)
-            
-            # Use the best score
-            best_score = max(score1, score2, score3)
-            
-            if best_score >= self.threshold:
-                matches.append((original_rom, best_score))
+        normalized_roms, core_roms = _prepare_names(rom_names)
+        usa_mask = np.array([self.is_usa_rom(rom) for rom in rom_names], dtype=bool)
         
-        if not matches:
+        scores = self.score_fuzzy_matches([img_name], normalized_roms, core_roms, usa_mask)
+        return self.pick_fuzzy_match(scores[0], rom_names, usa_mask)
+    
+    def score_fuzzy_matches(self, img_names: List[str], normalized_roms: List[str],
+                            core_roms: List[str], usa_mask: "np.ndarray") -> "np.ndarray":
+        """Score every image against every ROM in one vectorized pass.
+        Returns an (images x ROMs) matrix holding the best of the three strategies;
+        scores below the threshold come back as 0.
+        """
+        normalized_images, core_images = _prepare_names(img_names)
+        
+        def score(queries, choices, scorer):
+            # Names are already normalized, so no processor; float32 keeps the matrix compact
+            return process.cdist(queries, choices, scorer=scorer, processor=None,
+                                 score_cutoff=self.threshold, dtype=np.float32, workers=-1)
+        
+        # Try multiple matching strategies, keep the best score per pair.
+        # score_cutoff lets rapidfuzz bail out early on pairs that can't reach the threshold.
+        scores = score(normalized_images, normalized_roms, fuzz.ratio)
+        np.maximum(scores, score(core_images, core_roms, fuzz.ratio), out=scores)
+        
+        # partial_ratio is by far the slowest scorer, so skip it for images that already
+        # scored 100 on a ROM that would be picked (a USA ROM, or any ROM when none are USA).
+        # The only way partial_ratio could change that pick is a 100 on an earlier preferred
+        # ROM, which means a plain substring match, so check just that with str ops.
+        preferred = usa_mask if usa_mask.any() else np.ones_like(usa_mask)
+        perfect = (scores >= 100) & preferred
+        settled = perfect.any(axis=1)
+        
+        pending = np.flatnonzero(~settled)
+        if len(pending) == len(normalized_images):
+            np.maximum(scores, score(normalized_images, normalized_roms, fuzz.partial_ratio), out=scores)
+        elif len(pending):
+            partial = score([normalized_images[i] for i in pending], normalized_roms, fuzz.partial_ratio)
+            scores[pending] = np.maximum(scores[pending], partial)
+        
+        for row in np.flatnonzero(settled):
+            first_perfect = int(np.argmax(perfect[row]))
+            image = normalized_images[row]
+            for col in np.flatnonzero(preferred[:first_perfect]):
+                if _is_substring_match(image, normalized_roms[col]):
+                    scores[row, col] = 100
+                    break
+        
+        return scores
+    
+    def pick_fuzzy_match(self, scores: "np.ndarray", rom_names: List[str],
+                         usa_mask: "np.ndarray") -> Tuple[Optional[str], float]:
+        """Pick the best ROM from one row of fuzzy scores"""
+        candidates = scores >= self.threshold
+        if not candidates.any():
             return None, 0
         
         # If multiple matches, prefer USA versions
-        usa_matches = [m for m in matches if self.is_usa_rom(m[0])]
-        if usa_matches:
-            usa_matches.sort(key=lambda x: x[1], reverse=True)
-            return usa_matches[0]
-        
-        # Otherwise return highest scoring match
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[0]
+        usa_candidates = candidates & usa_mask
+        if usa_candidates.any():
+            candidates = usa_candidates
+        
+        # Highest score wins, ties go to the first ROM
+        best = int(np.argmax(np.where(candidates, scores, -1)))
+        return rom_names[best], float(scores[best])
+    
+    def prepare_rom_table(self):
+        """Precompute ROM lookup data once per ROM scan instead of once per image"""
+        self._rom_table_source = self.roms
+        self._rom_names = list(self.roms.keys()) if self.roms else []
+        self._rom_set = frozenset(self._rom_names)
+        self._rom_normalized, self._rom_core = _prepare_names(self._rom_names)
+        self._rom_usa_mask = np.array([self.is_usa_rom(rom) for rom in self._rom_names], dtype=bool)
     
     def match_images_to_roms(self, image_type: str, images: Dict[str, str]):
         """Match images in a specific type folder to ROMs"""
-        rom_names = list(self.roms.keys()) if self.roms else []
+        if self._rom_table_source is not self.roms:
+            self.prepare_rom_table()
+        rom_names = self._rom_names
         
         # Initialize priority stats for this image type
         if image_type in self.priority_folders:
             self.priority_stats[image_type] = {'matched': 0, 'total': len(images)}
         
+        # First pass: XML and exact name lookups, collect the rest for fuzzy matching
+        results = []  # [[img_path, matched_rom, match_type]] in scan order
+        fuzzy_names = []
+        fuzzy_slots = []
+        
         for img_name, img_path in images.items():
-            matched_rom = None
-            match_type = None
-            
             # Try XML matching first
             matched_rom = self.match_image_to_rom_xml(img_name)
-            if matched_rom:
-                match_type = 'xml'
+            match_type = 'xml' if matched_rom else None
             
             # Try exact ROM name match (already correctly named)
             if not matched_rom and rom_names:
-                matched_rom = self.match_image_to_rom_exact(img_name, rom_names)
+                matched_rom = self.match_image_to_rom_exact(img_name, self._rom_set)
                 if matched_rom:
                     match_type = 'exact'
             
-            # Fallback to fuzzy matching
             if not matched_rom and rom_names:
-                matched_rom, score = self.match_image_to_rom_fuzzy(img_name, rom_names)
-                if matched_rom and score >= self.threshold:
-                    match_type = 'fuzzy'
+                fuzzy_slots.append(len(results))
+                fuzzy_names.append(img_name)
             
+            results.append([img_path, matched_rom, match_type])
+        
+        # Fallback to fuzzy matching, scoring leftovers against all ROMs in blocks
+        # of images so the score matrices stay small on huge libraries
+        for start in range(0, len(fuzzy_names), FUZZY_BLOCK_SIZE):
+            block_names = fuzzy_names[start:start + FUZZY_BLOCK_SIZE]
+            block_slots = fuzzy_slots[start:start + FUZZY_BLOCK_SIZE]
+            
+            scores = self.score_fuzzy_matches(block_names, self._rom_normalized, self._rom_core,
+                                              self._rom_usa_mask)
+            for slot, row in zip(block_slots, scores):
+                matched_rom, score = self.pick_fuzzy_match(row, rom_names, self._rom_usa_mask)
+                if matched_rom and score >= self.threshold:
+                    results[slot][1] = matched_rom
+                    results[slot][2] = 'fuzzy'
+        
+        for img_path, matched_rom, match_type in results:
             # Record the match
             if matched_rom:
                 self.matches[img_path] = (matched_rom, image_type)
+                self.matched_roms.add(matched_rom)
                 self.stats['auto_matched'] += 1
                 
                 if match_type == 'xml':
@@ -459,10 +810,52 @@ class ROMImageMatcherV2:
                 self.unmatched_images.append((img_path, image_type))
                 self.stats['unmatched_images'] += 1
     
+    def copy_files_parallel(self, copies: List[Tuple[str, str]]) -> List[Optional[Exception]]:
+        """Copy (src, dst) pairs on a thread pool, return the error (or None) for each pair.
+        Copies that land on the same destination run in order on one worker, so the
+        last one still wins like it did with a sequential loop.
+        """
+        errors = [None] * len(copies)
+        
+        copies_by_dest = {}  # {destination: [copy indexes]}
+        for index, (src, dst) in enumerate(copies):
+            copies_by_dest.setdefault(dst.lower(), []).append(index)
+        
+        def copy_group(indexes):
+            for index in indexes:
+                src, dst = copies[index]
+                try:
+                    shutil.copy2(src, dst)
+                except Exception as e:
+                    errors[index] = e
+        
+        # Copies are I/O bound, shutil.copy2 releases the GIL while moving bytes
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(copy_group, copies_by_dest.values()))
+        
+        return errors
+    
     def execute_processing(self, image_types_to_process: List[str],
                           remove_duplicates: bool, move_unmatched: bool) -> Tuple[str, str, str]:
         """Execute the full processing workflow (v2.2: added video support)"""
-        log_lines = []
+        # Create output folder and open the log up front so report lines stream to disk
+        os.makedirs(self.output_folder, exist_ok=True)
+        log_path = os.path.join(self.output_folder, 
+                               f"processing_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        log_lines = _ProcessingLog(log_path)
+        try:
+            missing_roms_path = self.run_processing(log_lines, image_types_to_process,
+                                                    remove_duplicates, move_unmatched)
+        finally:
+            log_lines.close()
+        
+        return "\n".join(log_lines.tail), log_path, missing_roms_path
+    
+    def run_processing(self, log_lines: _ProcessingLog, image_types_to_process: List[str],
+                       remove_duplicates: bool, move_unmatched: bool) -> Optional[str]:
+        """Run every processing step, writing the report to log_lines.
+        Returns the Missing ROMs file path, or None if every ROM has an image
+        """
         log_lines.append(f"ROM Image Matcher v3.0 - Processing Report")
         log_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         log_lines.append("=" * 70)
@@ -473,15 +866,22 @@ class ROMImageMatcherV2:
             total_steps += 1
         if self.rom_folder:
             total_steps += 1
-        total_steps += len(image_types_to_process) * 2  # scan + match
+        total_steps += 1 + len(image_types_to_process)  # scan all + match each
         total_steps += 2  # copy files + cleanup
         
         current_step = 0
         
-        def update_progress(status_text):
+        def update_progress(status_text, throttle=False):
             nonlocal current_step
             current_step += 1
             if self.progress_callback:
+                # Repeated per-folder steps skip the GUI redraw when the last one was
+                # just drawn; phase changes and the final step always go through
+                now = time.monotonic()
+                if (throttle and current_step < total_steps
+                        and now - self._last_progress_time < PROGRESS_INTERVAL):
+                    return
+                self._last_progress_time = now
                 progress_pct = int((current_step / total_steps) * 100) if total_steps > 0 else 0
                 self.progress_callback(progress_pct, status_text)
         
@@ -504,31 +904,36 @@ class ROMImageMatcherV2:
             log_lines.append(f"\n--- ROM SCANNING ---")
             log_lines.append(f"ROM Folder: {self.rom_folder}")
             self.roms = self.scan_roms()
+            self.prepare_rom_table()
             self.stats['roms_found'] = len(self.roms)
             log_lines.append(f"ROMs found: {self.stats['roms_found']}")
         
+        # Scan all image type folders up front (in parallel)
+        update_progress("Scanning image folders...")
+        all_images, all_duplicates = self.scan_all_images(image_types_to_process)
+        
         # Process each image type
         total_duplicates_removed = 0
         
         for idx, image_type in enumerate(image_types_to_process):
-            update_progress(f"Scanning {image_type}...")
             log_lines.append(f"\n{'=' * 70}")
             log_lines.append(f"--- PROCESSING IMAGE TYPE: {image_type} ---")
             
-            type_folder_path = os.path.join(self.platform_image_folder, image_type)
-            images = self.scan_images_in_type_folder(type_folder_path)
+            images = all_images.get(image_type, {})
             
             log_lines.append(f"Images found: {len(images)}")
             self.stats['images_found'] += len(images)
             
             # Remove duplicates if enabled
             if remove_duplicates:
-                removed, images = self.remove_duplicates_in_folder(images)
+                removed, images = self.remove_duplicates_in_folder(
+                    images, all_duplicates.get(image_type, {}))
                 total_duplicates_removed += removed
                 if removed > 0:
                     log_lines.append(f"Duplicates removed: {removed}")
             
-            update_progress(f"Matching {image_type} ({idx+1}/{len(image_types_to_process)})...")
+            update_progress(f"Matching {image_type} ({idx+1}/{len(image_types_to_process)})...",
+                            throttle=True)
             # Match images to ROMs
             self.match_images_to_roms(image_type, images)
         
@@ -537,9 +942,6 @@ class ROMImageMatcherV2:
         
         update_progress("Copying/renaming files...")
         
-        # Create output folders
-        os.makedirs(self.output_folder, exist_ok=True)
-        
         # Create unmatched folder
         if move_unmatched:
             unmatched_base = os.path.join(self.platform_image_folder, "Unmatched_Images")
@@ -549,37 +951,43 @@ class ROMImageMatcherV2:
         log_lines.append(f"\n{'=' * 70}")
         log_lines.append("\n--- MATCHED AND RENAMED ---")
         
+        # Build output path with optional platform subfolder (v3.0)
+        if self.use_platform_subfolder and self.platform_name:
+            output_base = os.path.join(self.output_folder, self.platform_name)
+        else:
+            output_base = self.output_folder
+        
+        # Create each output type folder once instead of once per file
+        for image_type in {image_type for _, image_type in self.matches.values()}:
+            os.makedirs(os.path.join(output_base, image_type), exist_ok=True)
+        
+        # Plan every copy first, then run them on a thread pool
+        copy_jobs = []  # [(img_path, new_path, new_name, image_type)]
         for img_path, (rom_name, image_type) in self.matches.items():
-            img_ext = Path(img_path).suffix
+            img_ext = _split_ext(os.path.basename(img_path))[1]
             new_name = f"{rom_name}{img_ext}"
-            
-            # Build output path with optional platform subfolder (v3.0)
-            if self.use_platform_subfolder and self.platform_name:
-                output_type_folder = os.path.join(self.output_folder, self.platform_name, image_type)
+            new_path = os.path.join(output_base, image_type, new_name)
+            copy_jobs.append((img_path, new_path, new_name, image_type))
+        
+        copy_errors = self.copy_files_parallel([(src, dst) for src, dst, _, _ in copy_jobs])
+        
+        for (img_path, new_path, new_name, image_type), error in zip(copy_jobs, copy_errors):
+            if error is None:
+                log_lines.append(f"✓ [{image_type}] {os.path.basename(img_path)} → {new_name}")
             else:
-                output_type_folder = os.path.join(self.output_folder, image_type)
-            os.makedirs(output_type_folder, exist_ok=True)
-            
-            new_path = os.path.join(output_type_folder, new_name)
-            
-            try:
-                shutil.copy2(img_path, new_path)
-                log_lines.append(f"✓ [{image_type}] {Path(img_path).name} → {new_name}")
-            except Exception as e:
-                log_lines.append(f"✗ [{image_type}] Error copying {Path(img_path).name}: {e}")
+                log_lines.append(f"✗ [{image_type}] Error copying {os.path.basename(img_path)}: {error}")
         
         # Move unmatched images
         if move_unmatched and self.unmatched_images:
             log_lines.append(f"\n--- UNMATCHED IMAGES (Moved to Unmatched_Images) ---")
             
+            # Maintain folder structure in unmatched folder
+            for image_type in {image_type for _, image_type in self.unmatched_images}:
+                os.makedirs(os.path.join(unmatched_base, image_type), exist_ok=True)
+            
             for img_path, image_type in self.unmatched_images:
-                img_name = Path(img_path).name
-                
-                # Maintain folder structure in unmatched folder
-                unmatched_type_folder = os.path.join(unmatched_base, image_type)
-                os.makedirs(unmatched_type_folder, exist_ok=True)
-                
-                unmatched_path = os.path.join(unmatched_type_folder, img_name)
+                img_name = os.path.basename(img_path)
+                unmatched_path = os.path.join(unmatched_base, image_type, img_name)
                 
                 try:
                     shutil.move(img_path, unmatched_path)
@@ -591,9 +999,7 @@ class ROMImageMatcherV2:
         
         # Find ROMs without images
         if self.roms:
-            matched_roms = set(rom_name for rom_name, _ in self.matches.values())
-            all_roms = set(self.roms.keys())
-            self.unmatched_roms = list(all_roms - matched_roms)
+            self.unmatched_roms = list(self.roms.keys() - self.matched_roms)
             self.stats['no_match'] = len(self.unmatched_roms)
             
             log_lines.append(f"\n--- ROMS WITHOUT IMAGES ---")
@@ -659,14 +1065,6 @@ class ROMImageMatcherV2:
                     if missing > 0:
                         log_lines.append(f"   MISSING: {missing} images")
         
-        log_content = "\n".join(log_lines)
-        
-        # Save log file
-        log_path = os.path.join(self.output_folder, 
-                               f"processing_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.write(log_content)
-        
         # Export missing ROMs list if there are any
         missing_roms_path = None
         if self.unmatched_roms:
@@ -694,10 +1092,14 @@ class ROMImageMatcherV2:
                 for rom_name in sorted(self.unmatched_roms):
                     f.write(f"{rom_name}\n")
         
-        return log_content, log_path, missing_roms_path
+        return missing_roms_path
 
 
 class ROMImageMatcherGUIV2:
+    # Tk variables saved to CONFIG_PATH between sessions
+    SAVED_SETTINGS = ('xml_file_var', 'rom_folder_var', 'platform_image_folder_var',
+                      'output_folder_var', 'extension_pref_var', 'threshold_var')
+    
     def __init__(self, root):
         self.root = root
         self.root.title("ROM Image Matcher & Renamer v3.0 - TrailerVert Edition")
@@ -723,9 +1125,49 @@ class ROMImageMatcherGUIV2:
         self.progress_var = tk.IntVar(value=0)
         self.status_text_var = tk.StringVar(value="")
         
+        # Processing runs on a worker thread, which reports back through this queue
+        self._progress_queue = queue.Queue()
+        
+        # Image type scans, keyed by (folder, folder mtime) so repeat clicks skip the walk
+        self._scan_cache = {}  # {(folder, st_mtime_ns): [image_type]}
+        
+        # Set from the confirm dialog (or LBRENAME_SKIP_CONFIRM for scripted runs);
+        # deliberately not saved, so each launch asks again
+        self.skip_confirm_var = tk.BooleanVar(value=bool(os.environ.get("LBRENAME_SKIP_CONFIRM")))
+        self._processing = False
+        
         self.create_widgets()
-
-            
+        
+        # Restore last session's folders and options, save them again on close
+        self.restore_settings()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def restore_settings(self):
+        """Load the saved Tk variable values from the last session"""
+        settings = load_config().get(CONFIG_SECTION, {})
+        if not isinstance(settings, dict):
+            return
+        
+        for name in self.SAVED_SETTINGS:
+            if name in settings:
+                try:
+                    getattr(self, name).set(settings[name])
+                except tk.TclError:
+                    pass  # Wrong type in a hand-edited file, keep the default
+        
+        self.update_threshold_label(self.threshold_var.get())
+    
+    def on_close(self):
+        """Save the current settings and close the window"""
+        settings = {}
+        for name in self.SAVED_SETTINGS:
+            try:
+                settings[name] = getattr(self, name).get()
+            except tk.TclError:
+                pass
+        save_config_section(CONFIG_SECTION, settings)
+        self.root.destroy()
+    
     def create_widgets(self):
         # Main frame with padding
         main_frame = ttk.Frame(self.root, padding="10")
@@ -738,20 +1180,19 @@ class ROMImageMatcherGUIV2:
         
         row = 0
         
+        # Separators are plain filled frames; ttk.Separator tiles an image across
+        # its width on every resize
+        ttk.Style().configure('Sep.TFrame', background='#cccccc')
+        
         # TrailerVert Branding (v3.0)
         branding_frame = ttk.Frame(main_frame)
         branding_frame.grid(row=row, column=0, columnspan=3, pady=(0, 15))
         
         # Try to load logo
         try:
-            logo_path = resource_path('logo.png')
+            logo_img = load_logo_image(48)
             
-            if os.path.exists(logo_path):
-                logo_img = tk.PhotoImage(file=logo_path)
-                # Resize logo
-                subsample_x = max(1, logo_img.width() // 48)
-                subsample_y = max(1, logo_img.height() // 48)
-                logo_img = logo_img.subsample(subsample_x, subsample_y)
+            if logo_img is not None:
                 logo_label = ttk.Label(branding_frame, image=logo_img)
                 logo_label.image = logo_img  # Keep reference
                 logo_label.pack(side=tk.LEFT, padx=(0, 10))
@@ -803,7 +1244,7 @@ class ROMImageMatcherGUIV2:
         row += 1
         
         # Separator
-        ttk.Separator(main_frame, orient='horizontal').grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15)
+        ttk.Frame(main_frame, height=2, style='Sep.TFrame').grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15)
         row += 1
         
         # Processing mode selection
@@ -840,10 +1281,15 @@ class ROMImageMatcherGUIV2:
                                            command=self.scan_image_types)
         self.scan_types_button.grid(row=0, column=2)
         
+        # Skips the scan cache, for when images were added inside existing type folders
+        self.rescan_types_button = ttk.Button(type_frame, text="Force Rescan", 
+                                             command=lambda: self.scan_image_types(force=True))
+        self.rescan_types_button.grid(row=0, column=3, padx=(5, 0))
+        
         row += 1
         
         # Separator
-        ttk.Separator(main_frame, orient='horizontal').grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15)
+        ttk.Frame(main_frame, height=2, style='Sep.TFrame').grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=15)
         row += 1
         
         # Threshold slider (only used if no XML)
@@ -884,22 +1330,11 @@ class ROMImageMatcherGUIV2:
         ttk.Checkbutton(options_frame, text="Create platform subfolder in output (safer for bulk processing)", 
                        variable=self.use_platform_subfolder_var).pack(anchor=tk.W)
         
-        # Extension preference (v3.0)
-        ext_pref_frame = ttk.Frame(options_frame)
-        ext_pref_frame.pack(anchor=tk.W, fill=tk.X, pady=(5, 0))
-        
-        ttk.Label(ext_pref_frame, text="Prefer extension (for conflicts):").pack(side=tk.LEFT, padx=(0, 5))
+        # Extension preference (v3.0), widgets filled in by _ensure_ext_pref_widgets()
+        self._ext_pref_frame = ttk.Frame(options_frame)
+        self._ext_pref_frame.pack(anchor=tk.W, fill=tk.X, pady=(5, 0))
         self.extension_pref_var = tk.StringVar(value="None")
-        self.extension_pref_dropdown = ttk.Combobox(ext_pref_frame, 
-                                                    textvariable=self.extension_pref_var,
-                                                    values=["None", ".jpg", ".png", ".gif", ".bmp", ".webp"],
-                                                    state="readonly", 
-                                                    width=10)
-        self.extension_pref_dropdown.pack(side=tk.LEFT)
-        self.extension_pref_dropdown.current(0)
-        
-        ttk.Label(ext_pref_frame, text=" (when same image has multiple file types)", 
-                 font=('Arial', 8, 'italic')).pack(side=tk.LEFT, padx=(5, 0))
+        self.extension_pref_dropdown = None
         
         row += 1
         
@@ -929,9 +1364,11 @@ class ROMImageMatcherGUIV2:
                                      font=('Arial', 9))
         self.status_label.pack(anchor=tk.W, pady=(5, 0))
         
-        # Results text area
-        self.results_text = scrolledtext.ScrolledText(results_frame, height=12, wrap=tk.WORD)
-        self.results_text.pack(fill=tk.BOTH, expand=True)
+        # Results text area, created by _ensure_results_text()
+        self._results_frame = results_frame
+        self.results_text = None
+        self._results_generation = 0  # Bumped whenever the results area is replaced
+        self._results_pending = 0  # Chunks queued by show_results() not yet inserted
         row += 1
         
         # View log button
@@ -948,18 +1385,48 @@ class ROMImageMatcherGUIV2:
         
         # Initialize mode
         self.on_mode_change()
+        
+        # Build the less-used widgets once the main window has painted
+        self.root.after_idle(self._ensure_ext_pref_widgets)
+        self.root.after_idle(self._ensure_results_text)
+    
+    def _ensure_ext_pref_widgets(self):
+        """Create the extension preference controls (v3.0) if they don't exist yet"""
+        if self.extension_pref_dropdown is not None:
+            return
+        
+        ttk.Label(self._ext_pref_frame, text="Prefer extension (for conflicts):").pack(side=tk.LEFT, padx=(0, 5))
+        self.extension_pref_dropdown = ttk.Combobox(self._ext_pref_frame, 
+                                                    textvariable=self.extension_pref_var,
+                                                    values=["None", ".jpg", ".png", ".gif", ".bmp", ".webp"],
+                                                    state="readonly", 
+                                                    width=10)
+        self.extension_pref_dropdown.pack(side=tk.LEFT)  # Shows extension_pref_var ("None" by default)
+        
+        ttk.Label(self._ext_pref_frame, text=" (when same image has multiple file types)", 
+                 font=('Arial', 8, 'italic')).pack(side=tk.LEFT, padx=(5, 0))
+    
+    def _ensure_results_text(self):
+        """Create the results text area if it doesn't exist yet"""
+        if self.results_text is not None:
+            return
+        
+        self.results_text = scrolledtext.ScrolledText(self._results_frame, height=12, wrap=tk.WORD)
+        self.results_text.pack(fill=tk.BOTH, expand=True)
     
     def update_threshold_label(self, value):
         self.threshold_label.config(text=f"{int(float(value))}%")
     
     def on_mode_change(self):
         """Handle processing mode change"""
+        # Scan Types stays disabled while a run is in progress
+        scan_state = tk.DISABLED if self._processing else tk.NORMAL
         if self.process_mode_var.get() == "single":
             self.image_type_dropdown.config(state="readonly")
-            self.scan_types_button.config(state=tk.NORMAL)
+            self.scan_types_button.config(state=scan_state)
         else:
             self.image_type_dropdown.config(state=tk.DISABLED)
-            self.scan_types_button.config(state=tk.NORMAL)
+            self.scan_types_button.config(state=scan_state)
         
         # Update dropdown to add/remove "ALL" option if types already scanned
         if hasattr(self, 'matcher') and self.matcher.available_image_types:
@@ -968,7 +1435,10 @@ class ROMImageMatcherGUIV2:
                 dropdown_values = ["ALL - Process all types"] + image_types
             else:
                 dropdown_values = image_types
-            self.image_type_dropdown['values'] = dropdown_values
+            # Only hand Tk a new list when it actually changed
+            desired = tuple(dropdown_values)
+            if tuple(self.image_type_dropdown['values']) != desired:
+                self.image_type_dropdown['values'] = desired
             if dropdown_values:
                 self.image_type_dropdown.current(0)
     
@@ -987,26 +1457,43 @@ class ROMImageMatcherGUIV2:
         folder = filedialog.askdirectory(title="Select Platform Image Folder")
         if folder:
             self.platform_image_folder_var.set(folder)
+            self._scan_cache.clear()
     
     def browse_output_folder(self):
         folder = filedialog.askdirectory(title="Select Output Folder")
         if folder:
             self.output_folder_var.set(folder)
     
-    def scan_image_types(self):
-        """Scan platform image and video folders for available types (v2.2 updated)"""
+    def scan_image_types(self, force: bool = False):
+        """Scan platform image and video folders for available types (v2.2 updated)
+        Results are reused while the folder's mtime is unchanged, unless force is set.
+        """
         if not self.platform_image_folder_var.get():
             messagebox.showerror("Error", "Please select a Platform Image Folder first")
             return
         
-        self.matcher.platform_image_folder = self.platform_image_folder_var.get()
+        folder = self.platform_image_folder_var.get()
+        self.matcher.platform_image_folder = folder
+        
+        try:
+            cache_key = (folder, os.stat(folder).st_mtime_ns)
+        except OSError:
+            cache_key = None
         
-        self.status_var.set("Scanning for image types...")
-        self.status_text_var.set("Scanning folders...")
-        self.root.update()
+        if force:
+            self._scan_cache.clear()
         
-        # Scan image types
-        image_types = self.matcher.scan_image_types()
+        if cache_key in self._scan_cache:
+            image_types = list(self._scan_cache[cache_key])
+        else:
+            self.status_var.set("Scanning for image types...")
+            self.status_text_var.set("Scanning folders...")
+            self.root.update_idletasks()
+            
+            # Scan image types
+            image_types = self.matcher.scan_image_types()
+            if cache_key is not None:
+                self._scan_cache[cache_key] = list(image_types)
         
         if not image_types:
             messagebox.showwarning("No Image Types", "No image type folders found with images")
@@ -1028,11 +1515,9 @@ class ROMImageMatcherGUIV2:
         self.matcher.available_image_types = image_types
         
         # Display results
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"Image types found: {len(image_types)}\n\n")
-        self.results_text.insert(tk.END, "Available image types:\n")
-        for img_type in image_types:
-            self.results_text.insert(tk.END, f"  • {img_type}\n")
+        parts = [f"Image types found: {len(image_types)}\n\n", "Available image types:\n"]
+        parts.extend(f"  • {img_type}\n" for img_type in image_types)
+        self.show_results("".join(parts))
         
         self.process_button.config(state=tk.NORMAL)
         self.status_var.set(f"Found {len(image_types)} image types. Ready to process.")
@@ -1067,28 +1552,8 @@ class ROMImageMatcherGUIV2:
                 return
             image_types_to_process = [selected_type]
         
-        # Confirm with user
-        msg = f"Ready to process {len(image_types_to_process)} image type(s).\n\n"
-        
-        msg += "Image types:\n"
-        for img_type in image_types_to_process[:5]:
-            msg += f"  • {img_type}\n"
-        if len(image_types_to_process) > 5:
-            msg += f"  ... and {len(image_types_to_process) - 5} more\n"
-        
-        msg += "\nActions to be performed:\n"
-        if self.remove_duplicates_var.get():
-            msg += "• Remove duplicate images (keep -01 versions)\n"
-        if self.xml_file_var.get():
-            msg += "• Match using XML (primary method)\n"
-        if self.rom_folder_var.get():
-            msg += f"• Fuzzy match fallback (threshold: {self.threshold_var.get()}%)\n"
-        msg += "• Copy renamed images to output folder\n"
-        if self.move_unmatched_var.get():
-            msg += "• Move unmatched images to 'Unmatched_Images' folder\n"
-        msg += "\nProceed?"
-        
-        if not messagebox.askyesno("Confirm Processing", msg):
+        # Confirm with user (unless they opted out for this session)
+        if not self.skip_confirm_var.get() and not self.confirm_processing(image_types_to_process):
             return
         
         # Set matcher properties
@@ -1102,153 +1567,286 @@ class ROMImageMatcherGUIV2:
         self.matcher.use_platform_subfolder = self.use_platform_subfolder_var.get()
         
         # Extension preference (v3.0)
+        self._ensure_ext_pref_widgets()
         if self.extension_pref_var.get() != "None":
             self.matcher.extension_preference = self.extension_pref_var.get()
         else:
             self.matcher.extension_preference = None
         
-        # Set progress callback
+        # Set progress callback (called from the worker thread, so only queue the update)
         def update_progress(percentage, status_text):
-            self.progress_var.set(percentage)
-            self.status_text_var.set(status_text)
-            self.root.update()
+            self._progress_queue.put_nowait(('progress', (percentage, status_text)))
         
         self.matcher.progress_callback = update_progress
         
         # Reset stats
-        self.matcher.stats = {
-            'roms_found': 0,
-            'images_found': 0,
-            'duplicates_removed': 0,
-            'auto_matched': 0,
-            'xml_matched': 0,
-            'exact_matched': 0,
-            'fuzzy_matched': 0,
-            'no_match': 0,
-            'unmatched_images': 0,
-            'extension_conflicts': 0  # v3.0
-        }
-        self.matcher.priority_stats = {}
-        self.matcher.matches = {}
-        self.matcher.unmatched_images = []
-        self.matcher.unmatched_roms = []
-        self.matcher.extension_conflicts = []  # v3.0
+        self.matcher.reset_run_state()
         
         # Reset progress
         self.progress_var.set(0)
         self.status_text_var.set("Starting processing...")
         
         self.status_var.set("Processing...")
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Processing started...\n\n")
-        self.root.update()
+        self.show_results("Processing started...\n\n")
         
-        try:
-            log_content, log_path, missing_roms_path = self.matcher.execute_processing(
-                image_types_to_process,
-                self.remove_duplicates_var.get(),
-                self.move_unmatched_var.get()
-            )
-            
-            self.log_path = log_path
-            self.missing_roms_path = missing_roms_path
+        # Keep the buttons from starting a second run while this one is going
+        self._processing = True
+        self.process_button.config(state=tk.DISABLED)
+        self.scan_types_button.config(state=tk.DISABLED)
+        self.rescan_types_button.config(state=tk.DISABLED)
+        
+        remove_duplicates = self.remove_duplicates_var.get()
+        move_unmatched = self.move_unmatched_var.get()
+        
+        def worker():
+            try:
+                result = self.matcher.execute_processing(
+                    image_types_to_process,
+                    remove_duplicates,
+                    move_unmatched
+                )
+                self._progress_queue.put(('done', result))
+            except Exception as e:
+                logger.exception('Processing failed')
+                self._progress_queue.put(('error', e))
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(PROGRESS_POLL_MS, self._drain_progress, image_types_to_process)
+    
+    def confirm_processing(self, image_types_to_process: List[str]) -> bool:
+        """Ask before processing, with a "don't ask again this session" checkbox"""
+        parts = [f"Ready to process {len(image_types_to_process)} image type(s).\n\n"]
+        
+        parts.append("Image types:\n")
+        parts.extend(f"  • {img_type}\n" for img_type in islice(image_types_to_process, 5))
+        if len(image_types_to_process) > 5:
+            parts.append(f"  ... and {len(image_types_to_process) - 5} more\n")
+        
+        parts.append("\nActions to be performed:\n")
+        if self.remove_duplicates_var.get():
+            parts.append("• Remove duplicate images (keep -01 versions)\n")
+        if self.xml_file_var.get():
+            parts.append("• Match using XML (primary method)\n")
+        if self.rom_folder_var.get():
+            parts.append(f"• Fuzzy match fallback (threshold: {self.threshold_var.get()}%)\n")
+        parts.append("• Copy renamed images to output folder\n")
+        if self.move_unmatched_var.get():
+            parts.append("• Move unmatched images to 'Unmatched_Images' folder\n")
+        parts.append("\nProceed?")
+        msg = "".join(parts)
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Confirm Processing")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        
+        frame = ttk.Frame(dialog, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=msg, justify=tk.LEFT).pack(anchor=tk.W)
+        ttk.Checkbutton(frame, text="Don't ask again this session", 
+                       variable=self.skip_confirm_var).pack(anchor=tk.W, pady=(10, 0))
+        
+        confirmed = False
+        
+        def close(answer):
+            nonlocal confirmed
+            confirmed = answer
+            dialog.destroy()
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(15, 0))
+        yes_button = ttk.Button(button_frame, text="Yes", command=lambda: close(True))
+        yes_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="No", command=lambda: close(False)).pack(side=tk.LEFT, padx=5)
+        
+        dialog.bind('<Return>', lambda event: close(True))
+        dialog.bind('<Escape>', lambda event: close(False))
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        
+        dialog.grab_set()
+        yes_button.focus_set()
+        self.root.wait_window(dialog)
+        
+        # Only stop asking once the user has actually said yes
+        if not confirmed:
+            self.skip_confirm_var.set(False)
+        return confirmed
+    
+    def _drain_progress(self, image_types_to_process: List[str]):
+        """Apply queued worker updates on the Tk thread, then poll again until the run ends.
+        Only the newest progress update in each tick is drawn.
+        """
+        latest = None
+        finished = None  # ('done', result) or ('error', exception) once the worker ends
+        while finished is None:
+            try:
+                kind, payload = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Show summary
+            if kind == 'progress':
+                latest = payload
+            else:
+                finished = (kind, payload)
+        
+        if latest is not None:
+            percentage, status_text = latest
+            self.progress_var.set(percentage)
+            self.status_text_var.set(status_text)
+        
+        if finished is None:
+            self.root.after(PROGRESS_POLL_MS, self._drain_progress, image_types_to_process)
+            return
+        
+        self._processing = False
+        self.process_button.config(state=tk.NORMAL)
+        self.scan_types_button.config(state=tk.NORMAL)
+        self.rescan_types_button.config(state=tk.NORMAL)
+        
+        kind, payload = finished
+        if kind == 'done':
+            self.on_processing_done(payload, image_types_to_process)
+        else:
+            self.on_processing_error(payload)
+    
+    def on_processing_done(self, result: Tuple[str, str, str], image_types_to_process: List[str]):
+        """Show the summary once the worker thread has finished"""
+        log_content, log_path, missing_roms_path = result
+        
+        self.log_path = log_path
+        self.missing_roms_path = missing_roms_path
+        
+        # Show summary (built as one string so the Text widget lays out once)
+        parts = []
+        parts.append("=" * 60 + "\n")
+        parts.append("PROCESSING COMPLETE!\n")
+        parts.append("=" * 60 + "\n\n")
+        
+        if self.matcher.xml_file:
+            parts.append(f"✓ XML mappings loaded: {len(self.matcher.xml_mapping)}\n")
+        if self.matcher.roms:
+            parts.append(f"✓ ROMs found: {self.matcher.stats['roms_found']}\n")
+        parts.append(f"✓ Images processed: {self.matcher.stats['images_found']}\n")
+        parts.append(f"✓ Image types: {len(image_types_to_process)}\n")
+        if self.matcher.stats['duplicates_removed'] > 0:
+            parts.append(f"✓ Duplicates removed: {self.matcher.stats['duplicates_removed']}\n")
+        
+        parts.append(f"\n✓ Successfully matched: {self.matcher.stats['auto_matched']}\n")
+        if self.matcher.xml_file or self.matcher.stats['exact_matched'] > 0:
+            parts.append(f"  - Via XML: {self.matcher.stats['xml_matched']}\n")
+            parts.append(f"  - Via exact name: {self.matcher.stats['exact_matched']}\n")
+            parts.append(f"  - Via fuzzy: {self.matcher.stats['fuzzy_matched']}\n")
+        
+        parts.append(f"↺ Unmatched images: {self.matcher.stats['unmatched_images']}\n")
+        parts.append(f"⚠ ROMs without images: {self.matcher.stats['no_match']}\n")
+        
+        # Extension conflicts (v3.0)
+        if self.matcher.stats['extension_conflicts'] > 0:
+            parts.append(f"\n⚠ Extension conflicts: {self.matcher.stats['extension_conflicts']}\n")
+            if self.matcher.extension_preference:
+                parts.append(f"  Kept: {self.matcher.extension_preference} (preferred)\n")
+            else:
+                parts.append(f"  Kept: First alphabetically\n")
+        
+        # Priority folder coverage, looked up once for both the summary and the popup
+        priority_stats = self.matcher.priority_stats
+        total_roms = self.matcher.stats['roms_found']
+        priority_rows = []  # [(folder_name, matched, percentage, missing)]
+        for folder_name in self.matcher.priority_folders:
+            if folder_name in priority_stats:
+                matched = priority_stats[folder_name]['matched']
+                percentage = (matched / total_roms * 100) if total_roms > 0 else 0
+                priority_rows.append((folder_name, matched, percentage, total_roms - matched))
+        
+        # Show priority folder verification
+        if priority_stats and self.matcher.roms:
+            parts.append("\n" + "-" * 60 + "\n")
+            parts.append("PRIORITY FOLDERS VERIFICATION:\n")
+            parts.append("-" * 60 + "\n")
+            for folder_name, matched, percentage, missing in priority_rows:
+                status = "✓" if missing == 0 else "⚠"
+                outcome = f"MISSING: {missing}" if missing > 0 else "COMPLETE!"
+                parts.append(f"{status} {folder_name}: {matched} / {total_roms} ({percentage:.1f}%) - {outcome}\n")
+        
+        parts.append(f"\n{'=' * 60}\n")
+        parts.append(f"Output: {self.matcher.output_folder}\n")
+        parts.append(f"Log: {log_path}\n")
+        if missing_roms_path:
+            parts.append(f"Missing ROMs List: {missing_roms_path}\n")
+        
+        self.show_results("".join(parts))
+        
+        self.view_log_button.config(state=tk.NORMAL)
+        self.status_var.set("Processing complete!")
+        
+        # Build success message
+        success_msg = f"Processing complete!\n\n"
+        success_msg += f"Matched: {self.matcher.stats['auto_matched']}\n"
+        success_msg += f"Unmatched: {self.matcher.stats['unmatched_images']}\n"
+        success_msg += f"ROMs without images: {self.matcher.stats['no_match']}\n"
+        
+        if priority_stats:
+            success_msg += "\nPriority Folders:\n"
+            success_msg += "".join(f"  {folder_name}: {percentage:.1f}% ({matched}/{total_roms})\n"
+                                   for folder_name, matched, percentage, _ in priority_rows)
+        
+        if missing_roms_path:
+            success_msg += f"\nMissing ROMs list exported!"
+        
+        # Extension conflicts (v3.0)
+        if self.matcher.stats['extension_conflicts'] > 0:
+            success_msg += f"\n\n⚠ {self.matcher.stats['extension_conflicts']} extension conflicts handled"
+            if self.matcher.extension_preference:
+                success_msg += f" ({self.matcher.extension_preference} preferred)"
+        
+        messagebox.showinfo("Success", success_msg)
+        
+        # Reset progress bar
+        self.progress_var.set(100)
+        self.status_text_var.set("Complete!")
+    
+    def on_processing_error(self, e: Exception):
+        """Report an error raised on the worker thread"""
+        messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
+        self.status_var.set("Error occurred during processing")
+        self.show_results(f"\n❌ ERROR: {str(e)}\n", append=True)
+    
+    def show_results(self, text: str, append: bool = False):
+        """Replace (or append to) the results area.
+        Short text goes in with a single insert; long text is split into RESULTS_CHUNK_CHARS
+        blocks inserted from after_idle, so Tk handles events between layout passes.
+        The widget is kept read-only between updates, and the undo stack is cleared.
+        """
+        self._ensure_results_text()
+        if not append:
+            # Drop chunks still queued from an earlier, now replaced, summary
+            self._results_generation += 1
+            self._insert_results(self._results_generation, "", clear=True)
+        
+        generation = self._results_generation
+        if len(text) <= RESULTS_CHUNK_CHARS and not self._results_pending:
+            self._insert_results(generation, text)
+            return
+        
+        for start in range(0, len(text), RESULTS_CHUNK_CHARS):
+            self._results_pending += 1
+            self.root.after_idle(self._insert_results_chunk, generation,
+                                 text[start:start + RESULTS_CHUNK_CHARS])
+    
+    def _insert_results_chunk(self, generation: int, text: str):
+        """after_idle callback for show_results()"""
+        self._results_pending -= 1
+        self._insert_results(generation, text)
+    
+    def _insert_results(self, generation: int, text: str, clear: bool = False):
+        if generation != self._results_generation:
+            return
+        self.results_text.configure(state=tk.NORMAL)
+        if clear:
             self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, "=" * 60 + "\n")
-            self.results_text.insert(tk.END, "PROCESSING COMPLETE!\n")
-            self.results_text.insert(tk.END, "=" * 60 + "\n\n")
-            
-            if self.matcher.xml_file:
-                self.results_text.insert(tk.END, f"✓ XML mappings loaded: {len(self.matcher.xml_mapping)}\n")
-            if self.matcher.roms:
-                self.results_text.insert(tk.END, f"✓ ROMs found: {self.matcher.stats['roms_found']}\n")
-            self.results_text.insert(tk.END, f"✓ Images processed: {self.matcher.stats['images_found']}\n")
-            self.results_text.insert(tk.END, f"✓ Image types: {len(image_types_to_process)}\n")
-            if self.matcher.stats['duplicates_removed'] > 0:
-                self.results_text.insert(tk.END, f"✓ Duplicates removed: {self.matcher.stats['duplicates_removed']}\n")
-            
-            self.results_text.insert(tk.END, f"\n✓ Successfully matched: {self.matcher.stats['auto_matched']}\n")
-            if self.matcher.xml_file or self.matcher.stats['exact_matched'] > 0:
-                self.results_text.insert(tk.END, f"  - Via XML: {self.matcher.stats['xml_matched']}\n")
-                self.results_text.insert(tk.END, f"  - Via exact name: {self.matcher.stats['exact_matched']}\n")
-                self.results_text.insert(tk.END, f"  - Via fuzzy: {self.matcher.stats['fuzzy_matched']}\n")
-            
-            self.results_text.insert(tk.END, f"↺ Unmatched images: {self.matcher.stats['unmatched_images']}\n")
-            self.results_text.insert(tk.END, f"⚠ ROMs without images: {self.matcher.stats['no_match']}\n")
-            
-            # Extension conflicts (v3.0)
-            if self.matcher.stats['extension_conflicts'] > 0:
-                self.results_text.insert(tk.END, f"\n⚠ Extension conflicts: {self.matcher.stats['extension_conflicts']}\n")
-                if self.matcher.extension_preference:
-                    self.results_text.insert(tk.END, f"  Kept: {self.matcher.extension_preference} (preferred)\n")
-                else:
-                    self.results_text.insert(tk.END, f"  Kept: First alphabetically\n")
-            
-            # Show priority folder verification
-            if self.matcher.priority_stats and self.matcher.roms:
-                self.results_text.insert(tk.END, "\n" + "-" * 60 + "\n")
-                self.results_text.insert(tk.END, "PRIORITY FOLDERS VERIFICATION:\n")
-                self.results_text.insert(tk.END, "-" * 60 + "\n")
-                for folder_name in self.matcher.priority_folders:
-                    if folder_name in self.matcher.priority_stats:
-                        matched = self.matcher.priority_stats[folder_name]['matched']
-                        total_roms = self.matcher.stats['roms_found']
-                        percentage = (matched / total_roms * 100) if total_roms > 0 else 0
-                        missing = total_roms - matched
-                        status = "✓" if missing == 0 else "⚠"
-                        self.results_text.insert(tk.END, 
-                            f"{status} {folder_name}: {matched} / {total_roms} ({percentage:.1f}%)")
-                        if missing > 0:
-                            self.results_text.insert(tk.END, f" - MISSING: {missing}\n")
-                        else:
-                            self.results_text.insert(tk.END, " - COMPLETE!\n")
-            
-            self.results_text.insert(tk.END, f"\n{'=' * 60}\n")
-            self.results_text.insert(tk.END, f"Output: {self.matcher.output_folder}\n")
-            self.results_text.insert(tk.END, f"Log: {log_path}\n")
-            if missing_roms_path:
-                self.results_text.insert(tk.END, f"Missing ROMs List: {missing_roms_path}\n")
-            
-            self.view_log_button.config(state=tk.NORMAL)
-            self.status_var.set("Processing complete!")
-            
-            # Build success message
-            success_msg = f"Processing complete!\n\n"
-            success_msg += f"Matched: {self.matcher.stats['auto_matched']}\n"
-            success_msg += f"Unmatched: {self.matcher.stats['unmatched_images']}\n"
-            success_msg += f"ROMs without images: {self.matcher.stats['no_match']}\n"
-            
-            if self.matcher.priority_stats:
-                success_msg += "\nPriority Folders:\n"
-                for folder_name in self.matcher.priority_folders:
-                    if folder_name in self.matcher.priority_stats:
-                        matched = self.matcher.priority_stats[folder_name]['matched']
-                        total_roms = self.matcher.stats['roms_found']
-                        percentage = (matched / total_roms * 100) if total_roms > 0 else 0
-                        success_msg += f"  {folder_name}: {percentage:.1f}% ({matched}/{total_roms})\n"
-            
-            if missing_roms_path:
-                success_msg += f"\nMissing ROMs list exported!"
-            
-            # Extension conflicts (v3.0)
-            if self.matcher.stats['extension_conflicts'] > 0:
-                success_msg += f"\n\n⚠ {self.matcher.stats['extension_conflicts']} extension conflicts handled"
-                if self.matcher.extension_preference:
-                    success_msg += f" ({self.matcher.extension_preference} preferred)"
-            
-            messagebox.showinfo("Success", success_msg)
-            
-            # Reset progress bar
-            self.progress_var.set(100)
-            self.status_text_var.set("Complete!")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
-            self.status_var.set("Error occurred during processing")
-            self.results_text.insert(tk.END, f"\n❌ ERROR: {str(e)}\n")
-            import traceback
-            traceback.print_exc()
+        self.results_text.insert(tk.END, text)
+        self.results_text.configure(state=tk.DISABLED)
+        self.results_text.edit_reset()
     
     def view_log(self):
         if self.log_path and os.path.exists(self.log_path):
@@ -1256,15 +1854,25 @@ class ROMImageMatcherGUIV2:
             if os.name == 'nt':  # Windows
                 os.startfile(self.log_path)
             else:
-                messagebox.showinfo("Log Location", f"Log file saved at:\n{self.log_path}")
+                # Hand off to the desktop opener in a child process so Tk returns at once
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                try:
+                    subprocess.Popen([opener, self.log_path], close_fds=True,
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except OSError:
+                    messagebox.showinfo("Log Location", f"Log file saved at:\n{self.log_path}")
         else:
             messagebox.showerror("Error", "Log file not found")
 
 
 def main():
+    log_listener = start_error_logging()
     root = tk.Tk()
     app = ROMImageMatcherGUIV2(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -6,21 +6,36 @@ Professional TrailerVert branding with arcade cabinet logo.
 """
 
 import os
+import logging
+import logging.handlers
+import queue
 import shutil
 import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import re
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET  # Streams large platform XMLs much faster
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 
 try:
     from rapidfuzz import fuzz, process
+    import numpy as np
 except ImportError:
     messagebox.showerror("Missing Dependency", 
-                        "Please install rapidfuzz:\npip install rapidfuzz")
+                        "Please install rapidfuzz and numpy:\npip install rapidfuzz numpy")
     exit(1)
 
 
@@ -35,7 +50,136 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Videos scored per rapidfuzz.process.cdist call (bounds score matrix memory)
+FUZZY_BLOCK_SIZE = 512
+
+# Minimum seconds between repeated progress callbacks (~30 updates/sec)
+PROGRESS_INTERVAL = 0.033
+
+# How often the GUI drains progress updates posted by the processing thread
+PROGRESS_POLL_MS = 100
+
+# Processing errors are logged here with their traceback
+ERROR_LOG_PATH = os.path.join(os.path.expanduser('~'), '.trailervert_video_renamer.log')
+
+logger = logging.getLogger('rom_video_renamer')
+
+
+def start_error_logging() -> logging.handlers.QueueListener:
+    """Route logger records through a queue to ERROR_LOG_PATH, written on the listener's thread.
+    Call stop() on the returned listener at exit to flush it.
+    """
+    log_queue = queue.Queue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    
+    file_handler = logging.FileHandler(ERROR_LOG_PATH, encoding='utf-8', delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
+# Report lines kept in memory for the return value; the full report goes to the log file
+LOG_TAIL_LINES = 500
+
+# Name patterns, compiled once at import
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+
+# Characters LaunchBox replaces with '_' in media filenames
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in ':\'/\\?*"<>|'})
+
+
+def _split_ext(name: str) -> Tuple[str, str]:
+    """Split a file name into (stem, extension) with the same rules as Path.stem/suffix,
+    without building a Path object
+    """
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ''
+
+
+def _strip_suffix(name: str) -> str:
+    """Remove a -01, -02, etc. suffix from a name using plain string ops"""
+    dash = name.rfind('-')
+    if dash >= 0 and name[dash + 1:].isdecimal():
+        return name[:dash]
+    return name
+
+
+@lru_cache(maxsize=8192)
+def _normalize_name(name: str) -> str:
+    """Normalize filename for fuzzy comparison"""
+    name = Path(name).stem
+    name = _strip_suffix(name)
+    name = name.replace('_', ' ')
+    return ' '.join(name.split())
+
+
+@lru_cache(maxsize=8192)
+def _get_core_name(name: str) -> str:
+    """Get core game name without region tags for matching"""
+    # Most names without tags skip the regex engine entirely
+    if '(' not in name and '[' not in name:
+        return name.strip()
+    
+    core = _PAREN_RE.sub('', name)
+    core = _BRACKET_RE.sub('', core)
+    return core.strip()
+
+
+def _prepare_names(names: List[str]) -> Tuple[List[str], List[str]]:
+    """Return the (normalized, core) forms of names for fuzzy scoring"""
+    normalized = list(map(_normalize_name, names))
+    return normalized, list(map(_get_core_name, normalized))
+
+
+def _scan_files(folder: str):
+    """Yield a DirEntry for every file below folder, in the same order as os.walk"""
+    subfolders = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if not is_dir:
+                    yield entry
+                elif not entry.is_symlink():  # os.walk doesn't follow links
+                    subfolders.append(entry.path)
+    except OSError:
+        return
+    
+    for subfolder in subfolders:
+        yield from _scan_files(subfolder)
+
+
+class _ProcessingLog:
+    """Stream report lines straight to the log file, keeping only the last few in memory"""
+    
+    def __init__(self, path: str, tail_size: int = LOG_TAIL_LINES):
+        self.file = open(path, 'w', encoding='utf-8', buffering=1 << 16)
+        self.tail = deque(maxlen=tail_size)
+        self.empty = True
+    
+    def append(self, line: str):
+        if not self.empty:
+            self.file.write("\n")
+        self.file.write(line)
+        self.tail.append(line)
+        self.empty = False
+    
+    def close(self):
+        self.file.close()
+
+
 class ROMVideoRenamer:
+    # Video extensions
+    VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'})
+    
     def __init__(self):
         self.xml_file = ""
         self.rom_folder = ""
@@ -60,33 +204,30 @@ class ROMVideoRenamer:
         self.video_matches = {}  # {video_path: (rom_name, video_type_folder)}
         self.unmatched_videos = []
         self.available_video_types = []
+        self._root_videos_cache = (None, {})  # (root folder key, videos) from the last type scan
+        self._roms_cache = ((), {})  # (ROM folder keys, roms) from the last ROM scan
         
-        # Video extensions
-        self.video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
+        # ROM lookup table, built once per ROM scan (see prepare_rom_table)
+        self._rom_table_source = None  # The self.roms dict the table was built from
+        self._rom_names = []  # In scan order, fuzzy ties go to the first ROM
+        self._rom_normalized = []
+        self._rom_core = []
+        self._rom_usa_mask = None
         
         # Progress callback
         self.progress_callback = None
+        self._last_progress_time = 0.0
     
     def sanitize_title(self, title: str) -> str:
         """Sanitize title the way LaunchBox does for filenames"""
-        sanitized = title.replace(':', '_')
-        sanitized = sanitized.replace("'", '_')
-        sanitized = sanitized.replace('/', '_')
-        sanitized = sanitized.replace('\\', '_')
-        sanitized = sanitized.replace('?', '_')
-        sanitized = sanitized.replace('*', '_')
-        sanitized = sanitized.replace('"', '_')
-        sanitized = sanitized.replace('<', '_')
-        sanitized = sanitized.replace('>', '_')
-        sanitized = sanitized.replace('|', '_')
-        return sanitized
+        return title.translate(_SANITIZE_TABLE)
     
     def extract_platform_name(self) -> str:
         """Extract platform name from XML filename"""
         if not self.xml_file:
             return ""
         xml_filename = os.path.basename(self.xml_file)
-        platform_name = Path(xml_filename).stem
+        platform_name = _split_ext(xml_filename)[0]
         return platform_name
     
     def parse_xml(self) -> Dict[str, str]:
@@ -97,22 +238,30 @@ class ROMVideoRenamer:
             return mapping
         
         try:
-            tree = ET.parse(self.xml_file)
-            root = tree.getroot()
+            # Stream <Game> elements instead of building the whole tree
+            if HAS_LXML:
+                context = ET.iterparse(self.xml_file, events=('end',), tag='Game')
+            else:
+                context = ET.iterparse(self.xml_file, events=('end',))
             
-            for game in root.findall('Game'):
-                title_elem = game.find('Title')
-                app_path_elem = game.find('ApplicationPath')
+            for event, game in context:
+                if game.tag != 'Game':
+                    continue
                 
-                if title_elem is not None and app_path_elem is not None:
-                    title = title_elem.text
-                    app_path = app_path_elem.text
-                    
-                    if title and app_path:
-                        rom_filename = os.path.basename(app_path)
-                        rom_name_no_ext = Path(rom_filename).stem
-                        sanitized_title = self.sanitize_title(title)
-                        mapping[sanitized_title] = rom_name_no_ext
+                title = game.findtext('Title')
+                app_path = game.findtext('ApplicationPath')
+                
+                if title and app_path:
+                    rom_filename = os.path.basename(app_path)
+                    rom_name_no_ext = _split_ext(rom_filename)[0]
+                    sanitized_title = self.sanitize_title(title)
+                    mapping[sanitized_title] = rom_name_no_ext
+                
+                # Free parsed games so memory stays flat on large XMLs
+                game.clear()
+                if HAS_LXML:
+                    while game.getprevious() is not None:
+                        del game.getparent()[0]
             
             return mapping
         except Exception as e:
@@ -129,24 +278,39 @@ class ROMVideoRenamer:
         
         multi_file_extensions = {'.bin', '.gdi'}
         
-        for item in os.listdir(self.rom_folder):
-            item_path = os.path.join(self.rom_folder, item)
-            
-            if os.path.isfile(item_path):
-                name_no_ext = Path(item).stem
-                roms[name_no_ext] = item_path
-            elif os.path.isdir(item_path):
-                for subfile in os.listdir(item_path):
-                    subfile_path = os.path.join(item_path, subfile)
-                    if os.path.isfile(subfile_path):
-                        ext = Path(subfile).suffix.lower()
-                        if ext in multi_file_extensions:
-                            name_no_ext = Path(subfile).stem
-                            roms[name_no_ext] = subfile_path
-                            break
-        
+        # Folder mtimes, taken before each listing, let scan_roms_cached spot changes
+        folder_keys = [self._folder_key(self.rom_folder)]
+        
+        # scandir reuses the directory entry type instead of a stat() per item
+        with os.scandir(self.rom_folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    name_no_ext = _split_ext(entry.name)[0]
+                    roms[name_no_ext] = entry.path
+                elif entry.is_dir():
+                    folder_keys.append(self._folder_key(entry.path))
+                    with os.scandir(entry.path) as subentries:
+                        for subentry in subentries:
+                            if subentry.is_file():
+                                name_no_ext, ext = _split_ext(subentry.name)
+                                if ext.lower() in multi_file_extensions:
+                                    roms[name_no_ext] = subentry.path
+                                    break
+        
+        self._roms_cache = (tuple(folder_keys), roms)
         return roms
     
+    def scan_roms_cached(self) -> Dict[str, str]:
+        """Return the last scan_roms() result while the ROM folder is unchanged, else rescan.
+        Checks the mtime of the ROM folder and of every multi-file ROM subfolder, so
+        re-running on the same folder costs a few stat() calls instead of a full listing.
+        """
+        folder_keys, roms = self._roms_cache
+        if (folder_keys and folder_keys[0] is not None and folder_keys[0][0] == self.rom_folder
+                and all(key is not None and key == self._folder_key(key[0]) for key in folder_keys)):
+            return roms
+        return self.scan_roms()
+    
     def scan_video_types(self) -> List[str]:
         """Scan platform video folder and return list of video type folders"""
         types = []
@@ -154,79 +318,95 @@ class ROMVideoRenamer:
         if not os.path.exists(self.platform_video_folder):
             return types
         
-        # Check if root folder itself has videos (LaunchBox default dump location)
-        root_has_videos = False
-        for file in os.listdir(self.platform_video_folder):
-            file_path = os.path.join(self.platform_video_folder, file)
-            if os.path.isfile(file_path):
-                ext = Path(file).suffix.lower()
-                if ext in self.video_extensions:
-                    root_has_videos = True
-                    break
-        
-        if root_has_videos:
+        # One listing finds root videos (LaunchBox default dump location) and subfolders.
+        # The root videos are kept so processing can skip listing the folder again.
+        root_key = self._folder_key(self.platform_video_folder)
+        root_videos = {}
+        video_exts = ROMVideoRenamer.VIDEO_EXTS
+        with os.scandir(self.platform_video_folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if self.has_videos_recursive(entry.path):
+                        types.append(entry.name)
+                elif entry.is_file():
+                    name_no_ext, ext = _split_ext(entry.name)
+                    if ext.lower() in video_exts:
+                        root_videos[name_no_ext] = entry.path
+        self._root_videos_cache = (root_key, root_videos)
+        
+        if root_videos:
             types.append("Root")  # Special type for root folder
         
-        # Scan subfolders
-        for item in os.listdir(self.platform_video_folder):
-            item_path = os.path.join(self.platform_video_folder, item)
-            if os.path.isdir(item_path):
-                if self.has_videos_recursive(item_path):
-                    types.append(item)
-        
         return sorted(types)
     
+    def _folder_key(self, folder: str) -> Optional[Tuple[str, int]]:
+        """Return (folder, mtime) for cache checks; any file added, removed or renamed
+        directly in the folder changes its mtime. None if the folder can't be read.
+        """
+        try:
+            return folder, os.stat(folder).st_mtime_ns
+        except OSError:
+            return None
+    
     def has_videos_recursive(self, folder: str) -> bool:
-        """Check if folder contains any videos (recursively)"""
-        for root, dirs, files in os.walk(folder):
-            for file in files:
-                ext = Path(file).suffix.lower()
-                if ext in self.video_extensions:
-                    return True
-        return False
+        """Check if folder contains any videos (recursively), stopping at the first one"""
+        video_exts = ROMVideoRenamer.VIDEO_EXTS
+        return any(_split_ext(entry.name)[1].lower() in video_exts for entry in _scan_files(folder))
     
     def scan_videos_in_type_folder(self, type_folder_path: str) -> Dict[str, str]:
         """Scan a specific video type folder recursively, return {name_no_ext: full_path}"""
         videos = {}
+        video_exts = ROMVideoRenamer.VIDEO_EXTS
         
         # Special handling for "Root" type - scan only root folder, not recursively
         if type_folder_path == self.platform_video_folder or os.path.basename(type_folder_path) == "Root":
-            for file in os.listdir(self.platform_video_folder):
-                file_path = os.path.join(self.platform_video_folder, file)
-                if os.path.isfile(file_path):
-                    ext = Path(file).suffix.lower()
-                    if ext in self.video_extensions:
-                        name_no_ext = Path(file).stem
-                        base_name = re.sub(r'-\d+$', '', name_no_ext)
-                        videos[name_no_ext] = file_path
+            # Reuse the listing from scan_video_types while the folder is unchanged
+            root_key, root_videos = self._root_videos_cache
+            if root_key is not None and root_key == self._folder_key(self.platform_video_folder):
+                return dict(root_videos)
+            
+            with os.scandir(self.platform_video_folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        name_no_ext, ext = _split_ext(entry.name)
+                        if ext.lower() in video_exts:
+                            videos[name_no_ext] = entry.path
             return videos
         
         # Normal recursive scan for subfolders
-        for root, dirs, files in os.walk(type_folder_path):
-            for file in files:
-                ext = Path(file).suffix.lower()
-                if ext in self.video_extensions:
-                    file_path = os.path.join(root, file)
-                    name_no_ext = Path(file).stem
-                    base_name = re.sub(r'-\d+$', '', name_no_ext)
-                    videos[name_no_ext] = file_path
+        for entry in _scan_files(type_folder_path):
+            name_no_ext, ext = _split_ext(entry.name)
+            if ext.lower() in video_exts:
+                videos[name_no_ext] = entry.path
         
         return videos
     
+    def iter_scanned_videos(self, video_types: List[str]):
+        """Scan the video type folders on worker threads, one per folder, and yield
+        (video_type, videos) in the given order as soon as each folder is done.
+        The caller can match one type while later folders are still being walked.
+        """
+        if not video_types:
+            return
+        
+        # Handle Root specially - use platform video folder itself
+        type_folder_paths = [self.platform_video_folder if video_type == "Root"
+                             else os.path.join(self.platform_video_folder, video_type)
+                             for video_type in video_types]
+        
+        # Folder walks are I/O bound, so threads overlap the directory reads.
+        # Matching stays serial; process.cdist already spreads each call over all cores.
+        with ThreadPoolExecutor(max_workers=min(16, len(video_types))) as executor:
+            results = executor.map(self.scan_videos_in_type_folder, type_folder_paths)
+            yield from zip(video_types, results)
+    
     def normalize_name(self, name: str) -> str:
         """Normalize filename for fuzzy comparison"""
-        name = Path(name).stem
-        name = re.sub(r'-\d+$', '', name)
-        name = name.replace('_', ' ')
-        name = ' '.join(name.split())
-        return name
+        return _normalize_name(name)
     
     def get_core_name(self, name: str) -> str:
         """Get core game name without region tags for matching"""
-        core = re.sub(r'\([^)]*\)', '', name)
-        core = re.sub(r'\[[^\]]*\]', '', core)
-        core = core.strip()
-        return core
+        return _get_core_name(name)
     
     def is_usa_rom(self, rom_name: str) -> bool:
         """Check if ROM is USA region"""
@@ -237,86 +417,182 @@ class ROMVideoRenamer:
         if not self.xml_mapping:
             return None
         
-        base_name = re.sub(r'-\d+$', '', vid_name)
-        
-        if base_name in self.xml_mapping:
-            return self.xml_mapping[base_name]
-        
-        return None
+        return self.xml_mapping.get(_strip_suffix(vid_name))
     
-    def match_video_to_rom_exact(self, vid_name: str, rom_names: List[str]) -> Optional[str]:
+    def match_video_to_rom_exact(self, vid_name: str, roms: Dict[str, str]) -> Optional[str]:
         """Try to match video to ROM by exact name"""
-        base_name = re.sub(r'-\d+$', '', vid_name)
+        base_name = _strip_suffix(vid_name)
         
-        if base_name in rom_names:
+        # O(1) dict lookup instead of scanning a list of ROM names
+        if base_name in roms:
             return base_name
         
         return None
     
     def match_video_to_rom_fuzzy(self, vid_name: str, rom_names: List[str]) -> Tuple[Optional[str], float]:
         """Try to match video to ROM using fuzzy matching"""
-        normalized_video = self.normalize_name(vid_name)
-        core_video = self.get_core_name(normalized_video)
+        normalized_roms, core_roms = _prepare_names(rom_names)
+        usa_mask = np.array([self.is_usa_rom(rom) for rom in rom_names], dtype=bool)
         
-        rom_choices = []
-        for rom in rom_names:
-            normalized_rom = self.normalize_name(rom)
-            rom_choices.append((normalized_rom, rom))
+        scores = self.score_fuzzy_matches([vid_name], normalized_roms, core_roms)
+        return self.pick_fuzzy_match(scores[0], rom_names, usa_mask)
+    
+    def score_fuzzy_matches(self, vid_names: List[str], normalized_roms: List[str],
+                            core_roms: List[str]) -> "np.ndarray":
+        """Score every video against every ROM in one vectorized pass.
+        Returns a (videos x ROMs) matrix holding the best of the three strategies;
+        scores below the threshold come back as 0.
+        """
+        normalized_videos, core_videos = _prepare_names(vid_names)
         
-        matches = []
-        for normalized_rom, original_rom in rom_choices:
-            core_rom = self.get_core_name(normalized_rom)
-            
-            score1 = fuzz.ratio(normalized_video, normalized_rom)
-            score2 = fuzz.ratio(core_video, core_rom)
-            score3 = fuzz.partial_ratio(normalized_video, normalized_rom)
-            
-            best_score = max(score1, score2, score3)
-            
-            if best_score >= self.threshold:
-                matches.append((original_rom, best_score))
+        def score(queries, choices, scorer):
+            # Names are already normalized, so no processor; float32 keeps the matrix compact.
+            # score_cutoff also makes rapidfuzz skip pairs whose length gap alone rules out the
+            # threshold, so ratio needs no separate length-band prefilter.
+            return process.cdist(queries, choices, scorer=scorer, processor=None,
+                                 score_cutoff=self.threshold, dtype=np.float32, workers=-1)
         
-        if not matches:
+        # Try multiple matching strategies, keep the best score per pair
+        scores = score(normalized_videos, normalized_roms, fuzz.ratio)
+        np.maximum(scores, score(core_videos, core_roms, fuzz.ratio), out=scores)
+        np.maximum(scores, score(normalized_videos, normalized_roms, fuzz.partial_ratio), out=scores)
+        
+        return scores
+    
+    def pick_fuzzy_match(self, scores: "np.ndarray", rom_names: List[str],
+                         usa_mask: "np.ndarray") -> Tuple[Optional[str], float]:
+        """Pick the best ROM from one row of fuzzy scores"""
+        candidates = scores >= self.threshold
+        if not candidates.any():
             return None, 0
         
-        usa_matches = [m for m in matches if self.is_usa_rom(m[0])]
-        if usa_matches:
-            usa_matches.sort(key=lambda x: x[1], reverse=True)
-            return usa_matches[0]
+        # If multiple matches, prefer USA versions
+        usa_candidates = candidates & usa_mask
+        if usa_candidates.any():
+            candidates = usa_candidates
         
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[0]
+        # Highest score wins, ties go to the first ROM
+        best = int(np.argmax(np.where(candidates, scores, -1)))
+        return rom_names[best], float(scores[best])
+    
+    def prepare_rom_table(self):
+        """Precompute ROM lookup data once per ROM scan instead of once per video"""
+        self._rom_table_source = self.roms
+        self._rom_names = list(self.roms.keys()) if self.roms else []
+        self._rom_normalized, self._rom_core = _prepare_names(self._rom_names)
+        self._rom_usa_mask = np.array([self.is_usa_rom(rom) for rom in self._rom_names], dtype=bool)
     
     def match_videos_to_roms(self, video_type: str, videos: Dict[str, str]):
         """Match videos in a specific type folder to ROMs"""
-        rom_names = list(self.roms.keys()) if self.roms else []
+        if self._rom_table_source is not self.roms:
+            self.prepare_rom_table()
+        rom_names = self._rom_names
+        xml_mapping = self.xml_mapping
+        roms = self.roms
+        
+        # First pass: XML and exact name lookups, collect the rest for fuzzy matching
+        results = []  # [[vid_path, matched_rom]] in scan order
+        fuzzy_names = []
+        fuzzy_slots = []
         
         for vid_name, vid_path in videos.items():
-            matched_rom = None
+            # Strip the -01, -02 suffix once for both lookups
+            # (same as match_video_to_rom_xml / match_video_to_rom_exact)
+            base_name = _strip_suffix(vid_name)
             
             # Try XML matching first
-            matched_rom = self.match_video_to_rom_xml(vid_name)
+            matched_rom = xml_mapping.get(base_name)
             
             # Try exact ROM name match
-            if not matched_rom and rom_names:
-                matched_rom = self.match_video_to_rom_exact(vid_name, rom_names)
+            if not matched_rom and base_name in roms:
+                matched_rom = base_name
             
-            # Fallback to fuzzy matching
             if not matched_rom and rom_names:
-                matched_rom, score = self.match_video_to_rom_fuzzy(vid_name, rom_names)
-                if not (matched_rom and score >= self.threshold):
-                    matched_rom = None
+                fuzzy_slots.append(len(results))
+                fuzzy_names.append(vid_name)
             
-            if matched_rom:
-                self.video_matches[vid_path] = (matched_rom, video_type)
-                self.stats['videos_matched'] += 1
-            else:
-                self.unmatched_videos.append((vid_path, video_type))
-                self.stats['videos_unmatched'] += 1
+            results.append([vid_path, matched_rom])
+        
+        # Fallback to fuzzy matching, scoring leftovers against all ROMs in blocks
+        # of videos so the score matrices stay small on huge libraries
+        for start in range(0, len(fuzzy_names), FUZZY_BLOCK_SIZE):
+            block_names = fuzzy_names[start:start + FUZZY_BLOCK_SIZE]
+            block_slots = fuzzy_slots[start:start + FUZZY_BLOCK_SIZE]
+            
+            scores = self.score_fuzzy_matches(block_names, self._rom_normalized, self._rom_core)
+            for slot, row in zip(block_slots, scores):
+                matched_rom, score = self.pick_fuzzy_match(row, rom_names, self._rom_usa_mask)
+                results[slot][1] = matched_rom if matched_rom and score >= self.threshold else None
+        
+        # Record results in bulk and count them once per folder
+        matched = [(vid_path, (matched_rom, video_type))
+                   for vid_path, matched_rom in results if matched_rom]
+        unmatched = [(vid_path, video_type)
+                     for vid_path, matched_rom in results if not matched_rom]
+        self.video_matches.update(matched)
+        self.unmatched_videos.extend(unmatched)
+        self.stats['videos_matched'] += len(matched)
+        self.stats['videos_unmatched'] += len(unmatched)
+    
+    def move_file(self, src: str, dst: str):
+        """Move one file, replacing dst if it exists"""
+        # A plain rename when the output is on the same drive; shutil.move
+        # handles the rest (copy + delete across drives)
+        try:
+            os.replace(src, dst)
+        except OSError:
+            shutil.move(src, dst)
+    
+    def move_files_parallel(self, moves: List[Tuple[str, str]]) -> List[Optional[Exception]]:
+        """Move (src, dst) pairs on a thread pool, return the error (or None) for each move.
+        Moves onto the same destination run in order on one worker, so the last one
+        still wins exactly as it did when moving one file at a time.
+        """
+        errors = [None] * len(moves)
+        if not moves:
+            return errors
+        
+        by_destination = {}  # {normalized dst: [move index]}
+        for i, (src, dst) in enumerate(moves):
+            by_destination.setdefault(os.path.normcase(dst), []).append(i)
+        
+        def run(indices):
+            for i in indices:
+                try:
+                    self.move_file(*moves[i])
+                except Exception as e:
+                    errors[i] = e
+        
+        # A file that is both moved and overwritten must keep the sequential order
+        if any(os.path.normcase(src) in by_destination for src, _ in moves):
+            run(range(len(moves)))
+            return errors
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(run, by_destination.values()))
+        return errors
     
     def execute_processing(self, video_types_to_process: List[str]) -> Tuple[str, str]:
         """Execute the video processing workflow"""
-        log_lines = []
+        # Open the log up front so report lines stream to disk
+        if self.video_mode == "move":
+            log_folder = self.output_folder
+            os.makedirs(log_folder, exist_ok=True)
+        else:
+            log_folder = self.platform_video_folder
+        
+        log_path = os.path.join(log_folder, 
+                               f"video_processing_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        log_lines = _ProcessingLog(log_path)
+        try:
+            self.run_processing(log_lines, video_types_to_process)
+        finally:
+            log_lines.close()
+        
+        return "\n".join(log_lines.tail), log_path
+    
+    def run_processing(self, log_lines: _ProcessingLog, video_types_to_process: List[str]):
+        """Run every processing step, writing the report to log_lines"""
         log_lines.append(f"ROM Video Renamer v1.1 - TrailerVert Edition")
         log_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         log_lines.append("=" * 70)
@@ -327,15 +603,23 @@ class ROMVideoRenamer:
             total_steps += 1
         if self.rom_folder:
             total_steps += 1
-        total_steps += len(video_types_to_process) * 2  # scan + match
+        total_steps += 1  # scan video folders
+        total_steps += len(video_types_to_process)  # match
         total_steps += 1  # process files
         
         current_step = 0
         
-        def update_progress(status_text):
+        def update_progress(status_text, throttle=False):
             nonlocal current_step
             current_step += 1
             if self.progress_callback:
+                # Repeated per-folder steps skip the GUI redraw when the last one was
+                # just drawn; phase changes and the final step always go through
+                now = time.monotonic()
+                if (throttle and current_step < total_steps
+                        and now - self._last_progress_time < PROGRESS_INTERVAL):
+                    return
+                self._last_progress_time = now
                 progress_pct = int((current_step / total_steps) * 100) if total_steps > 0 else 0
                 self.progress_callback(progress_pct, status_text)
         
@@ -356,28 +640,26 @@ class ROMVideoRenamer:
             update_progress("Scanning ROMs...")
             log_lines.append(f"\n--- ROM SCANNING ---")
             log_lines.append(f"ROM Folder: {self.rom_folder}")
-            self.roms = self.scan_roms()
+            self.roms = self.scan_roms_cached()
+            if self._rom_table_source is not self.roms:
+                self.prepare_rom_table()
             self.stats['roms_found'] = len(self.roms)
             log_lines.append(f"ROMs found: {self.stats['roms_found']}")
         
+        # Scan video type folders in the background, matching each as it arrives
+        update_progress("Scanning video folders...")
+        scanned_videos = self.iter_scanned_videos(video_types_to_process)
+        
         # Process each video type
-        for idx, video_type in enumerate(video_types_to_process):
-            update_progress(f"Scanning videos: {video_type}...")
+        for idx, (video_type, videos) in enumerate(scanned_videos):
             log_lines.append(f"\n{'=' * 70}")
             log_lines.append(f"--- PROCESSING VIDEO TYPE: {video_type} ---")
             
-            # Handle Root specially - use platform video folder itself
-            if video_type == "Root":
-                type_folder_path = self.platform_video_folder
-            else:
-                type_folder_path = os.path.join(self.platform_video_folder, video_type)
-            
-            videos = self.scan_videos_in_type_folder(type_folder_path)
-            
             log_lines.append(f"Videos found: {len(videos)}")
             self.stats['videos_found'] += len(videos)
             
-            update_progress(f"Matching videos: {video_type} ({idx+1}/{len(video_types_to_process)})...")
+            update_progress(f"Matching videos: {video_type} ({idx+1}/{len(video_types_to_process)})...",
+                            throttle=True)
             self.match_videos_to_roms(video_type, videos)
         
         update_progress("Processing video files...")
@@ -386,50 +668,60 @@ class ROMVideoRenamer:
         log_lines.append(f"\n{'=' * 70}")
         log_lines.append("\n--- MATCHED AND RENAMED ---")
         
+        output_type_folders = {}  # {video_type: folder}, created once per type in move mode
+        moves = []  # [(vid_path, new_path, video_type, vid_filename, new_name)] in match order
+        
         for vid_path, (rom_name, video_type) in self.video_matches.items():
-            vid_ext = Path(vid_path).suffix
+            # Split the path once for the folder, file name and extension
+            vid_dir, vid_filename = os.path.split(vid_path)
+            vid_ext = _split_ext(vid_filename)[1]
             new_name = f"{rom_name}{vid_ext}"
             
             if self.video_mode == "rename":
                 # Rename in place
-                vid_dir = os.path.dirname(vid_path)
                 new_path = os.path.join(vid_dir, new_name)
                 
                 try:
                     os.rename(vid_path, new_path)
-                    log_lines.append(f"✓ [VIDEO-{video_type}] Renamed: {Path(vid_path).name} → {new_name}")
+                    log_lines.append(f"✓ [VIDEO-{video_type}] Renamed: {vid_filename} → {new_name}")
                 except Exception as e:
-                    log_lines.append(f"✗ [VIDEO-{video_type}] Error renaming {Path(vid_path).name}: {e}")
+                    log_lines.append(f"✗ [VIDEO-{video_type}] Error renaming {vid_filename}: {e}")
                     
             else:  # move mode
-                # Move to output folder with optional platform subfolder
-                if self.use_platform_subfolder and self.platform_name:
-                    # Handle root videos specially - they go directly in Videos/ folder
-                    if video_type == "Root":
-                        output_type_folder = os.path.join(self.output_folder, self.platform_name, "Videos")
-                    else:
-                        output_type_folder = os.path.join(self.output_folder, self.platform_name, "Videos", video_type)
-                else:
-                    # Handle root videos specially - they go directly in Videos/ folder
-                    if video_type == "Root":
-                        output_type_folder = os.path.join(self.output_folder, "Videos")
+                output_type_folder = output_type_folders.get(video_type)
+                if output_type_folder is None:
+                    # Move to output folder with optional platform subfolder
+                    if self.use_platform_subfolder and self.platform_name:
+                        # Handle root videos specially - they go directly in Videos/ folder
+                        if video_type == "Root":
+                            output_type_folder = os.path.join(self.output_folder, self.platform_name, "Videos")
+                        else:
+                            output_type_folder = os.path.join(self.output_folder, self.platform_name, "Videos", video_type)
                     else:
-                        output_type_folder = os.path.join(self.output_folder, "Videos", video_type)
-                os.makedirs(output_type_folder, exist_ok=True)
+                        # Handle root videos specially - they go directly in Videos/ folder
+                        if video_type == "Root":
+                            output_type_folder = os.path.join(self.output_folder, "Videos")
+                        else:
+                            output_type_folder = os.path.join(self.output_folder, "Videos", video_type)
+                    os.makedirs(output_type_folder, exist_ok=True)
+                    output_type_folders[video_type] = output_type_folder
                 
                 new_path = os.path.join(output_type_folder, new_name)
-                
-                try:
-                    shutil.move(vid_path, new_path)
-                    log_lines.append(f"✓ [VIDEO-{video_type}] Moved: {Path(vid_path).name} → {new_name}")
-                except Exception as e:
-                    log_lines.append(f"✗ [VIDEO-{video_type}] Error moving {Path(vid_path).name}: {e}")
+                moves.append((vid_path, new_path, video_type, vid_filename, new_name))
+        
+        # Cross-drive moves are copies, so run them on a thread pool and log in match order
+        errors = self.move_files_parallel([(vid_path, new_path) for vid_path, new_path, *_ in moves])
+        for (vid_path, new_path, video_type, vid_filename, new_name), error in zip(moves, errors):
+            if error is None:
+                log_lines.append(f"✓ [VIDEO-{video_type}] Moved: {vid_filename} → {new_name}")
+            else:
+                log_lines.append(f"✗ [VIDEO-{video_type}] Error moving {vid_filename}: {error}")
         
         # Unmatched videos
         if self.unmatched_videos:
             log_lines.append(f"\n--- UNMATCHED VIDEOS ---")
             for vid_path, video_type in self.unmatched_videos:
-                log_lines.append(f"⚠ [{video_type}] {Path(vid_path).name}")
+                log_lines.append(f"⚠ [{video_type}] {os.path.basename(vid_path)}")
         
         update_progress("Finalizing...")
         
@@ -445,21 +737,6 @@ class ROMVideoRenamer:
         log_lines.append(f"Videos matched: {self.stats['videos_matched']}")
         log_lines.append(f"Videos unmatched: {self.stats['videos_unmatched']}")
         log_lines.append(f"Mode: {self.video_mode}")
-        
-        log_content = "\n".join(log_lines)
-        
-        # Save log file
-        if self.video_mode == "move":
-            log_folder = self.output_folder
-        else:
-            log_folder = self.platform_video_folder
-        
-        log_path = os.path.join(log_folder, 
-                               f"video_processing_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.write(log_content)
-        
-        return log_content, log_path
 
 
 class ROMVideoRenamerGUI:
@@ -487,6 +764,13 @@ class ROMVideoRenamerGUI:
         self.progress_var = tk.IntVar(value=0)
         self.status_text_var = tk.StringVar(value="")
         
+        # Processing runs on a worker thread, which reports back through this queue
+        self._progress_queue = queue.Queue()
+        
+        # Set from the confirm dialog (or LBRENAME_SKIP_CONFIRM for scripted runs);
+        # deliberately not saved, so each launch asks again
+        self.skip_confirm_var = tk.BooleanVar(value=bool(os.environ.get("LBRENAME_SKIP_CONFIRM")))
+        
         self.create_widgets()
 
 
@@ -735,11 +1019,9 @@ class ROMVideoRenamerGUI:
         self.renamer.available_video_types = video_types
         
         # Display results
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"Video types found: {len(video_types)}\n\n")
-        self.results_text.insert(tk.END, "Available video types:\n")
-        for vid_type in video_types:
-            self.results_text.insert(tk.END, f"  • {vid_type}\n")
+        lines = [f"Video types found: {len(video_types)}\n", "Available video types:"]
+        lines.extend(f"  • {vid_type}" for vid_type in video_types)
+        self.show_results("\n".join(lines) + "\n")
         
         self.process_button.config(state=tk.NORMAL)
         self.status_var.set(f"Found {len(video_types)} video types. Ready to process.")
@@ -747,16 +1029,25 @@ class ROMVideoRenamerGUI:
     
     def start_processing(self):
         """Start the video processing workflow"""
+        # Read each setting once; every .get() is a round trip into Tcl
+        xml_file = self.xml_file_var.get()
+        rom_folder = self.rom_folder_var.get()
+        platform_video_folder = self.platform_video_folder_var.get()
+        output_folder = self.output_folder_var.get()
+        threshold = self.threshold_var.get()
+        video_mode = self.video_mode_var.get()
+        use_platform_subfolder = self.use_platform_subfolder_var.get()
+        
         # Validate inputs
-        if not self.platform_video_folder_var.get():
+        if not platform_video_folder:
             messagebox.showerror("Error", "Please select a Platform Video Folder")
             return
         
-        if self.video_mode_var.get() == "move" and not self.output_folder_var.get():
+        if video_mode == "move" and not output_folder:
             messagebox.showerror("Error", "Please select an Output Folder for move mode")
             return
         
-        if not self.xml_file_var.get() and not self.rom_folder_var.get():
+        if not xml_file and not rom_folder:
             messagebox.showerror("Error", "Please provide either a Platform XML or ROM Folder")
             return
         
@@ -767,45 +1058,23 @@ class ROMVideoRenamerGUI:
         video_types_to_process = self.renamer.available_video_types
         
         # Confirm with user
-        msg = f"Ready to process {len(video_types_to_process)} video type(s).\n\n"
-        msg += "Video types:\n"
-        for vid_type in video_types_to_process[:5]:
-            msg += f"  • {vid_type}\n"
-        if len(video_types_to_process) > 5:
-            msg += f"  ... and {len(video_types_to_process) - 5} more\n"
-        
-        msg += "\nActions to be performed:\n"
-        if self.xml_file_var.get():
-            msg += "• Match using XML (primary method)\n"
-        if self.rom_folder_var.get():
-            msg += f"• Fuzzy match fallback (threshold: {self.threshold_var.get()}%)\n"
-        
-        if self.video_mode_var.get() == "rename":
-            msg += "• Rename videos in place (no moving/copying)\n"
-        else:
-            msg += "• Move renamed videos to output folder\n"
-            if self.use_platform_subfolder_var.get():
-                msg += "• Create platform subfolder in output\n"
-        
-        msg += "\nProceed?"
-        
-        if not messagebox.askyesno("Confirm Processing", msg):
+        if not self.skip_confirm_var.get() and not self.confirm_processing(
+                video_types_to_process, xml_file, rom_folder, threshold,
+                video_mode, use_platform_subfolder):
             return
         
         # Set renamer properties
-        self.renamer.xml_file = self.xml_file_var.get()
-        self.renamer.rom_folder = self.rom_folder_var.get()
-        self.renamer.platform_video_folder = self.platform_video_folder_var.get()
-        self.renamer.output_folder = self.output_folder_var.get()
-        self.renamer.threshold = self.threshold_var.get()
-        self.renamer.video_mode = self.video_mode_var.get()
-        self.renamer.use_platform_subfolder = self.use_platform_subfolder_var.get()
-        
-        # Set progress callback
+        self.renamer.xml_file = xml_file
+        self.renamer.rom_folder = rom_folder
+        self.renamer.platform_video_folder = platform_video_folder
+        self.renamer.output_folder = output_folder
+        self.renamer.threshold = threshold
+        self.renamer.video_mode = video_mode
+        self.renamer.use_platform_subfolder = use_platform_subfolder
+        
+        # Set progress callback (called from the worker thread, so only queue the update)
         def update_progress(percentage, status_text):
-            self.progress_var.set(percentage)
-            self.status_text_var.set(status_text)
-            self.root.update()
+            self._progress_queue.put_nowait(('progress', (percentage, status_text)))
         
         self.renamer.progress_callback = update_progress
         
@@ -824,58 +1093,180 @@ class ROMVideoRenamerGUI:
         self.status_text_var.set("Starting processing...")
         
         self.status_var.set("Processing...")
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Processing started...\n\n")
-        self.root.update()
+        self.show_results("Processing started...\n\n")
+        
+        # Keep the buttons from starting a second run while this one is going
+        self.process_button.config(state=tk.DISABLED)
+        self.scan_button.config(state=tk.DISABLED)
+        
+        def worker():
+            try:
+                result = self.renamer.execute_processing(video_types_to_process)
+                self._progress_queue.put(('done', result))
+            except Exception as e:
+                logger.exception('Processing failed')
+                self._progress_queue.put(('error', e))
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(PROGRESS_POLL_MS, self._drain_progress, video_types_to_process)
+    
+    def confirm_processing(self, video_types_to_process: List[str], xml_file: str,
+                           rom_folder: str, threshold: int, video_mode: str,
+                           use_platform_subfolder: bool) -> bool:
+        """Ask before processing, with a "don't ask again this session" checkbox"""
+        # Message parts joined once
+        parts = [f"Ready to process {len(video_types_to_process)} video type(s).\n\n"]
+        
+        parts.append("Video types:\n")
+        parts.extend(f"  • {vid_type}\n" for vid_type in video_types_to_process[:5])
+        if len(video_types_to_process) > 5:
+            parts.append(f"  ... and {len(video_types_to_process) - 5} more\n")
         
-        try:
-            log_content, log_path = self.renamer.execute_processing(video_types_to_process)
-            
-            self.log_path = log_path
+        parts.append("\nActions to be performed:\n")
+        if xml_file:
+            parts.append("• Match using XML (primary method)\n")
+        if rom_folder:
+            parts.append(f"• Fuzzy match fallback (threshold: {threshold}%)\n")
+        
+        if video_mode == "rename":
+            parts.append("• Rename videos in place (no moving/copying)\n")
+        else:
+            parts.append("• Move renamed videos to output folder\n")
+            if use_platform_subfolder:
+                parts.append("• Create platform subfolder in output\n")
+        
+        parts.append("\nProceed?")
+        msg = "".join(parts)
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Confirm Processing")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        
+        frame = ttk.Frame(dialog, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=msg, justify=tk.LEFT).pack(anchor=tk.W)
+        ttk.Checkbutton(frame, text="Don't ask again this session", 
+                       variable=self.skip_confirm_var).pack(anchor=tk.W, pady=(10, 0))
+        
+        confirmed = False
+        
+        def close(answer):
+            nonlocal confirmed
+            confirmed = answer
+            dialog.destroy()
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(15, 0))
+        yes_button = ttk.Button(button_frame, text="Yes", command=lambda: close(True))
+        yes_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="No", command=lambda: close(False)).pack(side=tk.LEFT, padx=5)
+        
+        dialog.bind('<Return>', lambda event: close(True))
+        dialog.bind('<Escape>', lambda event: close(False))
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        
+        dialog.grab_set()
+        yes_button.focus_set()
+        self.root.wait_window(dialog)
+        
+        # Only stop asking once the user has actually said yes
+        if not confirmed:
+            self.skip_confirm_var.set(False)
+        return confirmed
+    
+    def _drain_progress(self, video_types_to_process: List[str]):
+        """Apply queued worker updates on the Tk thread, then poll again until the run ends.
+        Only the newest progress update in each tick is drawn.
+        """
+        latest = None
+        finished = None  # ('done', result) or ('error', exception) once the worker ends
+        while finished is None:
+            try:
+                kind, payload = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Show summary
+            if kind == 'progress':
+                latest = payload
+            else:
+                finished = (kind, payload)
+        
+        if latest is not None:
+            percentage, status_text = latest
+            self.progress_var.set(percentage)
+            self.status_text_var.set(status_text)
+        
+        if finished is None:
+            self.root.after(PROGRESS_POLL_MS, self._drain_progress, video_types_to_process)
+            return
+        
+        self.process_button.config(state=tk.NORMAL)
+        self.scan_button.config(state=tk.NORMAL)
+        
+        kind, payload = finished
+        if kind == 'done':
+            self.on_processing_done(payload, video_types_to_process)
+        else:
+            self.on_processing_error(payload)
+    
+    def on_processing_done(self, result: Tuple[str, str], video_types_to_process: List[str]):
+        """Show the summary once the worker thread has finished"""
+        log_content, log_path = result
+        
+        self.log_path = log_path
+        
+        # Show summary (built as one string so the Text widget lays out once)
+        parts = []
+        parts.append("=" * 60 + "\n")
+        parts.append("PROCESSING COMPLETE!\n")
+        parts.append("=" * 60 + "\n\n")
+        
+        if self.renamer.xml_file:
+            parts.append(f"✓ XML mappings loaded: {len(self.renamer.xml_mapping)}\n")
+        if self.renamer.roms:
+            parts.append(f"✓ ROMs found: {self.renamer.stats['roms_found']}\n")
+        parts.append(f"✓ Videos processed: {self.renamer.stats['videos_found']}\n")
+        parts.append(f"✓ Video types: {len(video_types_to_process)}\n")
+        
+        parts.append(f"\n✓ Videos matched: {self.renamer.stats['videos_matched']}\n")
+        parts.append(f"⚠ Videos unmatched: {self.renamer.stats['videos_unmatched']}\n")
+        
+        # The run's own mode; the radio buttons may have changed while it was going
+        mode_text = "Renamed in place" if self.renamer.video_mode == "rename" else "Moved to output"
+        parts.append(f"✓ Action: {mode_text}\n")
+        
+        parts.append(f"\n{'=' * 60}\n")
+        parts.append(f"Log: {log_path}\n")
+        
+        self.show_results("".join(parts))
+        
+        self.view_log_button.config(state=tk.NORMAL)
+        self.status_var.set("Processing complete!")
+        
+        # Build success message
+        success_msg = f"Processing complete!\n\n"
+        success_msg += f"Videos matched: {self.renamer.stats['videos_matched']}\n"
+        success_msg += f"Videos unmatched: {self.renamer.stats['videos_unmatched']}\n"
+        success_msg += f"Action: {mode_text}"
+        
+        messagebox.showinfo("Success", success_msg)
+        
+        # Reset progress bar
+        self.progress_var.set(100)
+        self.status_text_var.set("Complete!")
+    
+    def on_processing_error(self, e: Exception):
+        """Report an error raised on the worker thread"""
+        messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
+        self.status_var.set("Error occurred during processing")
+        self.show_results(f"\n❌ ERROR: {str(e)}\n", append=True)
+    
+    def show_results(self, text: str, append: bool = False):
+        """Replace (or append to) the results area with a single insert"""
+        if not append:
             self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, "=" * 60 + "\n")
-            self.results_text.insert(tk.END, "PROCESSING COMPLETE!\n")
-            self.results_text.insert(tk.END, "=" * 60 + "\n\n")
-            
-            if self.renamer.xml_file:
-                self.results_text.insert(tk.END, f"✓ XML mappings loaded: {len(self.renamer.xml_mapping)}\n")
-            if self.renamer.roms:
-                self.results_text.insert(tk.END, f"✓ ROMs found: {self.renamer.stats['roms_found']}\n")
-            self.results_text.insert(tk.END, f"✓ Videos processed: {self.renamer.stats['videos_found']}\n")
-            self.results_text.insert(tk.END, f"✓ Video types: {len(video_types_to_process)}\n")
-            
-            self.results_text.insert(tk.END, f"\n✓ Videos matched: {self.renamer.stats['videos_matched']}\n")
-            self.results_text.insert(tk.END, f"⚠ Videos unmatched: {self.renamer.stats['videos_unmatched']}\n")
-            
-            mode_text = "Renamed in place" if self.video_mode_var.get() == "rename" else "Moved to output"
-            self.results_text.insert(tk.END, f"✓ Action: {mode_text}\n")
-            
-            self.results_text.insert(tk.END, f"\n{'=' * 60}\n")
-            self.results_text.insert(tk.END, f"Log: {log_path}\n")
-            
-            self.view_log_button.config(state=tk.NORMAL)
-            self.status_var.set("Processing complete!")
-            
-            # Build success message
-            success_msg = f"Processing complete!\n\n"
-            success_msg += f"Videos matched: {self.renamer.stats['videos_matched']}\n"
-            success_msg += f"Videos unmatched: {self.renamer.stats['videos_unmatched']}\n"
-            success_msg += f"Action: {mode_text}"
-            
-            messagebox.showinfo("Success", success_msg)
-            
-            # Reset progress bar
-            self.progress_var.set(100)
-            self.status_text_var.set("Complete!")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
-            self.status_var.set("Error occurred during processing")
-            self.results_text.insert(tk.END, f"\n❌ ERROR: {str(e)}\n")
-            import traceback
-            traceback.print_exc()
+        self.results_text.insert(tk.END, text)
     
     def view_log(self):
         if hasattr(self, 'log_path') and os.path.exists(self.log_path):
@@ -888,7 +1279,15 @@ class ROMVideoRenamerGUI:
             messagebox.showwarning("No Log", "No log file available")
 
 
-if __name__ == "__main__":
+def main():
+    log_listener = start_error_logging()
     root = tk.Tk()
     app = ROMVideoRenamerGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        log_listener.stop()
+
+
+if __name__ == "__main__":
+    main()